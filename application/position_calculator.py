@@ -14,29 +14,92 @@ The calculator therefore maintains:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date as _date
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Optional
+from sys import intern
+from typing import Iterable, Optional
 
 from domain.entities import Position, Transaction
 from domain.enums import AssetClass, Currency, TradeType, TransactionType
-from domain.value_objects import round_monetary, round_qty
+from domain.value_objects import round_monetary
 
 
 ZERO = Decimal("0")
 MONETARY_Q = Decimal("0.01")
 QTY_Q = Decimal("0.00000001")
 
+# Internal fixed-point scales: quantities are held as integer units of
+# 1e-8 and monetary values as integer cents, so the hot path runs on
+# native ``int`` arithmetic instead of Decimal quantize calls.
+QTY_SCALE = 10 ** 8
+MONETARY_SCALE = 100
+
+
+def _to_scaled(value: Decimal, scale: int) -> int:
+    """Convert a Decimal to an integer count of 1/*scale* units (HALF_UP)."""
+    return int((value * scale).to_integral_value(ROUND_HALF_UP))
+
+
+def _div_half_up(num: int, den: int) -> int:
+    """Integer division rounded ROUND_HALF_UP (ties away from zero)."""
+    q, r = divmod(abs(num), den)
+    if 2 * r >= den:
+        q += 1
+    return q if num >= 0 else -q
+
+
+def _qty_to_decimal(qty_e8: int) -> Decimal:
+    return Decimal(qty_e8).scaleb(-8) if qty_e8 else ZERO
+
+
+def _cents_to_decimal(cents: int) -> Decimal:
+    return Decimal(cents).scaleb(-2)
+
+
+# SPLIT/INPLIT of one event arrive as a batch (one tx per institution);
+# their global recalculation is deferred until the ticker is next read.
+_CORPORATE_ACTIONS = frozenset({TransactionType.SPLIT, TransactionType.INPLIT})
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Internal mutable helper
 # ═══════════════════════════════════════════════════════════════════════════
 
+class _TickerGlobal:
+    """Aggregated totals for a single ticker across all institutions.
+
+    avg_price is computed on first read after a BUY/BONUS/recalc marks it
+    stale (``_avg_cents = None``), so consecutive BUYs share one division.
+    """
+    __slots__ = ("quantity_e8", "total_cost_cents", "_avg_cents")
+
+    def __init__(self) -> None:
+        self.quantity_e8 = 0
+        self.total_cost_cents = 0
+        self._avg_cents: Optional[int] = 0
+
+    @property
+    def avg_price_cents(self) -> int:
+        avg = self._avg_cents
+        if avg is None:
+            q = self.quantity_e8
+            avg = self._avg_cents = (
+                _div_half_up(self.total_cost_cents * QTY_SCALE, q)
+                if q > 0 else 0
+            )
+        return avg
+
+
 class _MutablePosition:
+    """Per-institution quantity, in scaled integer units.
+
+    The average price is global per ticker, so it is read from the shared
+    ``_TickerGlobal`` instead of being copied into every institution.
+    """
     __slots__ = (
         "ticker", "asset_class", "currency", "institution",
-        "quantity", "avg_price", "total_cost",
+        "quantity_e8", "_global",
     )
 
     def __init__(
@@ -45,31 +108,32 @@ class _MutablePosition:
         asset_class: AssetClass,
         currency: Currency,
         institution: str,
+        global_: _TickerGlobal,
     ) -> None:
         self.ticker = ticker
         self.asset_class = asset_class
         self.currency = currency
         self.institution = institution
-        self.quantity = ZERO
-        self.avg_price = ZERO
-        self.total_cost = ZERO
-
+        self.quantity_e8 = 0
+        self._global = global_
 
-class _TickerGlobal:
-    """Aggregated totals for a single ticker across all institutions."""
-    __slots__ = ("quantity", "total_cost", "avg_price")
+    @property
+    def avg_price_cents(self) -> int:
+        return self._global.avg_price_cents
 
-    def __init__(self) -> None:
-        self.quantity = ZERO
-        self.total_cost = ZERO
-        self.avg_price = ZERO
+    @property
+    def total_cost_cents(self) -> int:
+        """Cost basis at the global avg_price (qty × avg, ROUND_HALF_UP)."""
+        if self.quantity_e8 <= 0:
+            return 0
+        return _div_half_up(self.quantity_e8 * self._global.avg_price_cents, QTY_SCALE)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Sale result VO
 # ═══════════════════════════════════════════════════════════════════════════
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SaleResult:
     """Result of processing a SELL transaction."""
     ticker: str
@@ -84,14 +148,25 @@ class SaleResult:
     gain_loss: Decimal
     currency: Currency
     fx_rate: Decimal
+    # BRL conversions, computed once in __post_init__
+    _gain_brl: Decimal = field(init=False, repr=False, compare=False)
+    _proceeds_brl: Decimal = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "_gain_brl", round_monetary(self.gain_loss * self.fx_rate)
+        )
+        object.__setattr__(
+            self, "_proceeds_brl", round_monetary(self.proceeds * self.fx_rate)
+        )
 
     @property
     def gain_loss_brl(self) -> Decimal:
-        return round_monetary(self.gain_loss * self.fx_rate)
+        return self._gain_brl
 
     @property
     def proceeds_brl(self) -> Decimal:
-        return round_monetary(self.proceeds * self.fx_rate)
+        return self._proceeds_brl
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -110,17 +185,25 @@ class PositionCalculator:
         for tx in sorted_transactions:
             calc.process(tx)
         positions = calc.get_positions()
+
+    or, for a whole history at once, ``sales = calc.replay(sorted_transactions)``.
     """
 
     def __init__(self) -> None:
-        # key = "TICKER@INSTITUTION"
-        self._positions: dict[str, _MutablePosition] = {}
+        # key = (TICKER, INSTITUTION)
+        self._positions: dict[tuple[str, str], _MutablePosition] = {}
         # key = "TICKER"  — global avg_price tracker
         self._globals: dict[str, _TickerGlobal] = {}
+        # key = "TICKER"  — every per-institution position of the ticker
+        self._by_ticker: dict[str, list[_MutablePosition]] = {}
+        # tickers whose globals await a recalc after SPLIT/INPLIT
+        self._dirty_globals: set[str] = set()
 
     def reset(self) -> None:
         self._positions.clear()
         self._globals.clear()
+        self._by_ticker.clear()
+        self._dirty_globals.clear()
 
     def _get_global(self, ticker: str) -> _TickerGlobal:
         g = self._globals.get(ticker)
@@ -131,208 +214,211 @@ class PositionCalculator:
 
     def process(self, tx: Transaction) -> SaleResult | None:
         """Process a single transaction and return a SaleResult for sells."""
-        key = f"{tx.ticker}@{tx.institution}"
+        # Interned keys let the dict lookups below hit the identity fast path
+        ticker = intern(tx.ticker)
+        institution = intern(tx.institution)
+        if ticker in self._dirty_globals and tx.type not in _CORPORATE_ACTIONS:
+            self._flush_dirty(ticker)
+
+        key = (ticker, institution)
         pos = self._positions.get(key)
 
         if pos is None:
             pos = _MutablePosition(
-                ticker=tx.ticker,
+                ticker=ticker,
                 asset_class=tx.asset_class,
                 currency=tx.currency,
-                institution=tx.institution,
+                institution=institution,
+                global_=self._get_global(ticker),
             )
             self._positions[key] = pos
-
-        if tx.type == TransactionType.BUY:
-            return self._buy(pos, tx)
-        elif tx.type == TransactionType.SELL:
-            return self._sell(pos, tx)
-        elif tx.type == TransactionType.SPLIT:
-            return self._split(pos, tx)
-        elif tx.type == TransactionType.INPLIT:
-            return self._inplit(pos, tx)
-        elif tx.type == TransactionType.BONUS:
-            return self._bonus(pos, tx)
-        elif tx.type in (TransactionType.DIVIDEND, TransactionType.JCP):
-            return None  # dividends/JCP don't affect position
-        return None
+            self._by_ticker.setdefault(ticker, []).append(pos)
+
+        # DIVIDEND/JCP have no handler: they don't affect the position
+        handler = self._DISPATCH.get(tx.type)
+        return handler(self, pos, tx) if handler is not None else None
+
+    def replay(self, transactions: Iterable[Transaction]) -> list[SaleResult]:
+        """Process an ordered batch of transactions and return the sales.
+
+        Equivalent to calling process() for each transaction; intended for
+        full rebuilds where the whole history is known up front.
+        """
+        process = self.process
+        sale_results: list[SaleResult] = []
+        append = sale_results.append
+        for tx in transactions:
+            sr = process(tx)
+            if sr is not None:
+                append(sr)
+        return sale_results
 
     # ── operations ─────────────────────────────────────────────────────
 
-    def _buy(self, pos: _MutablePosition, tx: Transaction) -> None:
+    # The handlers below bind the module-level helpers they use as
+    # keyword-only defaults, turning global lookups into fast locals.
+
+    def _buy(
+        self, pos: _MutablePosition, tx: Transaction, *,
+        _to_scaled=_to_scaled, _div_half_up=_div_half_up, QTY_SCALE=QTY_SCALE,
+        MONETARY_SCALE=MONETARY_SCALE,
+    ) -> None:
         """BUY: update per-institution and global-per-ticker totals."""
-        buy_qty = tx.quantity
-        buy_cost = round_monetary(tx.quantity * tx.price)
+        buy_qty = _to_scaled(tx.quantity, QTY_SCALE)
+        price = _to_scaled(tx.price, MONETARY_SCALE)
+        buy_cost = _div_half_up(buy_qty * price, QTY_SCALE)
 
         # Update per-institution
-        pos.quantity = round_qty(pos.quantity + buy_qty)
-        pos.total_cost = round_monetary(pos.total_cost + buy_cost)
+        pos.quantity_e8 += buy_qty
 
         # Update global per-ticker
         g = self._get_global(tx.ticker)
-        g.quantity = round_qty(g.quantity + buy_qty)
-        g.total_cost = round_monetary(g.total_cost + buy_cost)
-        g.avg_price = (
-            round_monetary(g.total_cost / g.quantity)
-            if g.quantity > ZERO else ZERO
-        )
-
-        # Propagate global avg_price to ALL positions of this ticker
-        self._sync_avg_price(tx.ticker)
+        g.quantity_e8 += buy_qty
+        g.total_cost_cents += buy_cost
+        g._avg_cents = None
         return None
 
-    def _sell(self, pos: _MutablePosition, tx: Transaction) -> SaleResult:
+    def _sell(
+        self, pos: _MutablePosition, tx: Transaction, *,
+        _to_scaled=_to_scaled, _div_half_up=_div_half_up, QTY_SCALE=QTY_SCALE,
+        MONETARY_SCALE=MONETARY_SCALE, _cents_to_decimal=_cents_to_decimal,
+    ) -> SaleResult:
         """SELL: use global avg_price for cost basis."""
-        sell_qty = tx.quantity
-        sell_price = tx.price
+        sell_qty = _to_scaled(tx.quantity, QTY_SCALE)
+        sell_price = _to_scaled(tx.price, MONETARY_SCALE)
         g = self._get_global(tx.ticker)
-        avg = g.avg_price  # global avg_price
+        avg = g.avg_price_cents  # global avg_price
 
-        cost_of_sold = round_monetary(sell_qty * avg)
-        proceeds = round_monetary(sell_qty * sell_price)
-        gain_loss = round_monetary(proceeds - cost_of_sold)
+        cost_of_sold = _div_half_up(sell_qty * avg, QTY_SCALE)
+        proceeds = _div_half_up(sell_qty * sell_price, QTY_SCALE)
+        gain_loss = proceeds - cost_of_sold
 
         # Update per-institution
-        new_qty = round_qty(pos.quantity - sell_qty)
-        if new_qty <= ZERO:
-            pos.quantity = ZERO
-            pos.total_cost = ZERO
-        else:
-            pos.quantity = new_qty
-            pos.total_cost = round_monetary(new_qty * avg)
+        pos.quantity_e8 = max(pos.quantity_e8 - sell_qty, 0)
 
         # Update global
-        g.quantity = round_qty(g.quantity - sell_qty)
-        if g.quantity <= ZERO:
-            g.quantity = ZERO
-            g.total_cost = ZERO
-            g.avg_price = ZERO
+        g.quantity_e8 -= sell_qty
+        if g.quantity_e8 <= 0:
+            g.quantity_e8 = 0
+            g.total_cost_cents = 0
+            g._avg_cents = 0
         else:
-            g.total_cost = round_monetary(g.quantity * avg)
+            g.total_cost_cents = _div_half_up(g.quantity_e8 * avg, QTY_SCALE)
             # avg_price doesn't change on sell
 
-        # Propagate global avg_price to all positions of this ticker
-        self._sync_avg_price(tx.ticker)
-
         return SaleResult(
             ticker=tx.ticker,
             date=tx.date,
             trade_type=tx.trade_type,
             asset_class=tx.asset_class,
-            sell_qty=sell_qty,
-            sell_price=sell_price,
-            avg_cost=avg,
-            proceeds=proceeds,
-            cost_of_sold=cost_of_sold,
-            gain_loss=gain_loss,
+            sell_qty=tx.quantity,
+            sell_price=tx.price,
+            avg_cost=_cents_to_decimal(avg),
+            proceeds=_cents_to_decimal(proceeds),
+            cost_of_sold=_cents_to_decimal(cost_of_sold),
+            gain_loss=_cents_to_decimal(gain_loss),
             currency=tx.currency,
             fx_rate=tx.fx_rate,
         )
 
-    def _split(self, pos: _MutablePosition, tx: Transaction) -> None:
+    def _split(
+        self, pos: _MutablePosition, tx: Transaction, *,
+        _to_scaled=_to_scaled, _div_half_up=_div_half_up, QTY_SCALE=QTY_SCALE,
+    ) -> None:
         """SPLIT: multiply qty, divide avg_price. tx.quantity = split factor."""
-        factor = tx.quantity
-        if factor <= ZERO:
+        factor = _to_scaled(tx.quantity, QTY_SCALE)
+        if factor <= 0:
             return
 
+        # A split comes as a single transaction for a specific institution,
+        # but the factor applies to ALL shares of the ticker: the caller
+        # sends one split tx per institution, and the global total is the
+        # sum of all per-institution quantities — recalculated once the
+        # whole batch has been applied.
+        self._defer_recalc(tx.ticker)
+
         # Update per-institution
-        pos.quantity = round_qty(pos.quantity * factor)
-        # total_cost stays the same
+        pos.quantity_e8 = _div_half_up(pos.quantity_e8 * factor, QTY_SCALE)
 
-        # Update global
-        g = self._get_global(tx.ticker)
-        g.quantity = round_qty(g.quantity * (factor - Decimal("1")))  # add the delta
-        # Actually simpler: recalc from all positions after split
-        # But since split applies to the whole ticker, we need to handle
-        # all positions of this ticker. Let's do it differently.
-        # WAIT: A split comes as a single transaction for a specific
-        # institution. But the split factor applies to ALL shares.
-        # Since we're called once per institution, the caller should
-        # have one split tx per institution. The global total is the
-        # sum of all per-institution quantities.
-        # After applying the factor to this institution's qty, we
-        # recalc the global from scratch.
-        self._recalc_global(tx.ticker)
-
-    def _inplit(self, pos: _MutablePosition, tx: Transaction) -> None:
+    def _inplit(
+        self, pos: _MutablePosition, tx: Transaction, *,
+        _to_scaled=_to_scaled, _div_half_up=_div_half_up, QTY_SCALE=QTY_SCALE,
+    ) -> None:
         """INPLIT (reverse split): divide qty, multiply avg_price."""
-        factor = tx.quantity
-        if factor <= ZERO:
+        factor = _to_scaled(tx.quantity, QTY_SCALE)
+        if factor <= 0:
             return
 
-        # Update per-institution
-        pos.quantity = round_qty(pos.quantity / factor)
-        # total_cost stays the same
+        # Recalc global from all positions once the batch is applied
+        self._defer_recalc(tx.ticker)
 
-        # Recalc global from all positions
-        self._recalc_global(tx.ticker)
+        # Update per-institution
+        pos.quantity_e8 = _div_half_up(pos.quantity_e8 * QTY_SCALE, factor)
 
-    def _bonus(self, pos: _MutablePosition, tx: Transaction) -> None:
+    def _bonus(
+        self, pos: _MutablePosition, tx: Transaction, *,
+        _to_scaled=_to_scaled, QTY_SCALE=QTY_SCALE,
+    ) -> None:
         """BONUS shares: increase qty at zero cost → reduces avg_price."""
-        bonus_qty = tx.quantity
+        bonus_qty = _to_scaled(tx.quantity, QTY_SCALE)
 
         # Update per-institution
-        pos.quantity = round_qty(pos.quantity + bonus_qty)
+        pos.quantity_e8 += bonus_qty
         # total_cost stays the same
 
         # Update global
         g = self._get_global(tx.ticker)
-        g.quantity = round_qty(g.quantity + bonus_qty)
+        g.quantity_e8 += bonus_qty
         # total_cost stays the same
-        g.avg_price = (
-            round_monetary(g.total_cost / g.quantity)
-            if g.quantity > ZERO else ZERO
-        )
-
-        # Propagate global avg_price
-        self._sync_avg_price(tx.ticker)
+        g._avg_cents = None
 
     # ── helpers ────────────────────────────────────────────────────────
 
-    def _sync_avg_price(self, ticker: str) -> None:
-        """Copy the global avg_price to all per-institution positions."""
-        g = self._globals.get(ticker)
-        if g is None:
-            return
-        for pos in self._positions.values():
-            if pos.ticker == ticker:
-                pos.avg_price = g.avg_price
-                # Also sync total_cost = qty * avg_price
-                pos.total_cost = (
-                    round_monetary(pos.quantity * g.avg_price)
-                    if pos.quantity > ZERO else ZERO
-                )
+    def _defer_recalc(self, ticker: str) -> None:
+        """Mark *ticker* dirty for a corporate action.
+
+        A split/inplit leaves the cent-exact global total_cost as it is;
+        _flush_dirty recomputes the quantity and divides that cost by it,
+        instead of re-deriving the cost from an already-rounded avg_price.
+        """
+        self._dirty_globals.add(ticker)
+
+    def _flush_dirty(self, ticker: str) -> None:
+        self._dirty_globals.discard(ticker)
+        self._recalc_global(ticker)
 
     def _recalc_global(self, ticker: str) -> None:
-        """Recompute global totals from per-institution positions."""
-        total_qty = ZERO
-        total_cost = ZERO
-        for pos in self._positions.values():
-            if pos.ticker == ticker:
-                total_qty = round_qty(total_qty + pos.quantity)
-                total_cost = round_monetary(total_cost + pos.total_cost)
+        """Recompute global quantity and avg_price from per-institution
+        quantities; the global total_cost is left untouched."""
         g = self._get_global(ticker)
-        g.quantity = total_qty
-        g.total_cost = total_cost
-        g.avg_price = (
-            round_monetary(total_cost / total_qty)
-            if total_qty > ZERO else ZERO
+        g.quantity_e8 = sum(
+            pos.quantity_e8 for pos in self._by_ticker.get(ticker, ())
         )
-        self._sync_avg_price(ticker)
+        g._avg_cents = None
+
+    _DISPATCH = {
+        TransactionType.BUY: _buy,
+        TransactionType.SELL: _sell,
+        TransactionType.SPLIT: _split,
+        TransactionType.INPLIT: _inplit,
+        TransactionType.BONUS: _bonus,
+    }
 
     # ── results ────────────────────────────────────────────────────────
 
     def get_positions(self) -> list[Position]:
         """Return the current state of all positions as domain entities."""
+        for ticker in list(self._dirty_globals):
+            self._flush_dirty(ticker)
         result = []
         for pos in self._positions.values():
             p = Position(
                 ticker=pos.ticker,
                 asset_class=pos.asset_class,
-                quantity=pos.quantity,
-                avg_price=pos.avg_price,
+                quantity=_qty_to_decimal(pos.quantity_e8),
+                avg_price=_cents_to_decimal(pos.avg_price_cents),
                 currency=pos.currency,
-                total_cost=pos.total_cost,
+                total_cost=_cents_to_decimal(pos.total_cost_cents),
                 institution=pos.institution,
             )
             p.seal()
@@ -341,3 +427,12 @@ class PositionCalculator:
 
     def get_open_positions(self) -> list[Position]:
         return [p for p in self.get_positions() if p.is_open]
+
+    def get_quantity(self, ticker: str, institution: str) -> Decimal:
+        """Return the current quantity of *ticker* at *institution*.
+
+        Per-institution quantities never depend on other institutions, so
+        this needs neither the global recalc nor building Position objects.
+        """
+        pos = self._positions.get((ticker, institution))
+        return _qty_to_decimal(pos.quantity_e8) if pos is not None else ZERO
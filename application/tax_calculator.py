@@ -25,6 +25,11 @@ IRRF_DAY_RATE    = Decimal("0.01")    # 1 % sobre o ganho
 MONTHLY_EXEMPTION_LIMIT = Decimal("20000.00")
 
 
+def _to_cents(value: Decimal) -> int:
+    """Integer cents of an already 2-decimal monetary value."""
+    return int(value.scaleb(2))
+
+
 class TaxCalculatorBR:
     """Calcula o imposto de renda sobre ganho de capital no Brasil.
 
@@ -47,16 +52,50 @@ class TaxCalculatorBR:
         Returns a list of TaxResult objects and **mutates** accumulated_losses
         in-place to carry forward updated values.
         """
-        # Group sales by (asset_class, trade_type)
-        groups: dict[tuple[AssetClass, TradeType], list] = defaultdict(list)
+        # Sums and differences of 2-decimal values stay exactly 2-decimal,
+        # so only products below are passed through round_monetary.
+        # Sum BRL gain/proceeds per (asset_class, trade_type) in a single
+        # pass, in integer cents — one Decimal per group instead of one
+        # Decimal addition per sale.
+        groups: defaultdict[tuple[AssetClass, TradeType], list[int]] = (
+            defaultdict(lambda: [0, 0])
+        )
+        to_cents = _to_cents  # local alias for the per-sale loop
         for sr in sale_results:
-            groups[(sr.asset_class, sr.trade_type)].append(sr)
+            totals = groups[sr.asset_class, sr.trade_type]
+            totals[0] += to_cents(sr.gain_loss_brl)
+            totals[1] += to_cents(sr.proceeds_brl)
 
         results: list[TaxResult] = []
 
-        for (asset_class, trade_type), sales in groups.items():
-            total_gain_brl = sum(sr.gain_loss_brl for sr in sales)
-            total_proceeds_brl = sum(sr.proceeds_brl for sr in sales)
+        for (asset_class, trade_type), (gain_cents, proceeds_cents) in groups.items():
+            total_gain_brl = Decimal(gain_cents).scaleb(-2)
+            total_proceeds_brl = Decimal(proceeds_cents).scaleb(-2)
+            rate = self._RATES[trade_type]
+
+            loss_key = (asset_class, trade_type)
+            acc_loss = accumulated_losses.get(loss_key, ZERO)
+
+            def emit(
+                taxable: Decimal = ZERO,
+                tax_due: Decimal = ZERO,
+                irrf: Decimal = ZERO,
+                darf: Decimal = ZERO,
+                acc_after: Decimal = acc_loss,
+            ) -> None:
+                results.append(TaxResult(
+                    month_ref=month_ref,
+                    asset_class=asset_class,
+                    trade_type=trade_type,
+                    gross_gain=total_gain_brl,
+                    accumulated_loss_before=acc_loss,
+                    taxable_gain=taxable,
+                    tax_rate=rate,
+                    tax_due=tax_due,
+                    irrf_withheld=irrf,
+                    darf_to_pay=darf,
+                    accumulated_loss_after=acc_after,
+                ))
 
             # Check monthly exemption for ações (swing trade only)
             if (
@@ -65,116 +104,64 @@ class TaxCalculatorBR:
                 and total_proceeds_brl <= MONTHLY_EXEMPTION_LIMIT
             ):
                 # Exempt — no tax, but losses are NOT offset
-                results.append(TaxResult(
-                    month_ref=month_ref,
-                    asset_class=asset_class,
-                    trade_type=trade_type,
-                    gross_gain=total_gain_brl,
-                    accumulated_loss_before=accumulated_losses.get(
-                        (asset_class, trade_type), ZERO
-                    ),
-                    taxable_gain=ZERO,
-                    tax_rate=SWING_TRADE_RATE,
-                    tax_due=ZERO,
-                    irrf_withheld=ZERO,
-                    darf_to_pay=ZERO,
-                    accumulated_loss_after=accumulated_losses.get(
-                        (asset_class, trade_type), ZERO
-                    ),
-                ))
+                emit()
                 continue
 
             # Accumulated loss carry-forward
-            loss_key = (asset_class, trade_type)
-            acc_loss = accumulated_losses.get(loss_key, ZERO)
-
             if total_gain_brl < ZERO:
                 # Month had a net LOSS → accumulate
-                new_acc_loss = round_monetary(acc_loss + abs(total_gain_brl))
+                new_acc_loss = acc_loss + abs(total_gain_brl)
                 accumulated_losses[loss_key] = new_acc_loss
-                results.append(TaxResult(
-                    month_ref=month_ref,
-                    asset_class=asset_class,
-                    trade_type=trade_type,
-                    gross_gain=total_gain_brl,
-                    accumulated_loss_before=acc_loss,
-                    taxable_gain=ZERO,
-                    tax_rate=self._rate(trade_type),
-                    tax_due=ZERO,
-                    irrf_withheld=ZERO,
-                    darf_to_pay=ZERO,
-                    accumulated_loss_after=new_acc_loss,
-                ))
+                emit(acc_after=new_acc_loss)
                 continue
 
             # Net gain — offset with accumulated losses
-            taxable = round_monetary(total_gain_brl - acc_loss)
+            taxable = total_gain_brl - acc_loss
             if taxable < ZERO:
                 # Still has remaining loss
-                remaining_loss = round_monetary(abs(taxable))
+                remaining_loss = -taxable
                 accumulated_losses[loss_key] = remaining_loss
-                results.append(TaxResult(
-                    month_ref=month_ref,
-                    asset_class=asset_class,
-                    trade_type=trade_type,
-                    gross_gain=total_gain_brl,
-                    accumulated_loss_before=acc_loss,
-                    taxable_gain=ZERO,
-                    tax_rate=self._rate(trade_type),
-                    tax_due=ZERO,
-                    irrf_withheld=ZERO,
-                    darf_to_pay=ZERO,
-                    accumulated_loss_after=remaining_loss,
-                ))
+                emit(acc_after=remaining_loss)
                 continue
 
             # Taxable gain exists
             accumulated_losses[loss_key] = ZERO
-            rate = self._rate(trade_type)
             tax_due = round_monetary(taxable * rate)
 
             # IRRF (dedo-duro)
-            irrf = self._compute_irrf(
-                trade_type, total_proceeds_brl, total_gain_brl
-            )
-
-            darf = round_monetary(max(tax_due - irrf, ZERO))
-
-            results.append(TaxResult(
-                month_ref=month_ref,
-                asset_class=asset_class,
-                trade_type=trade_type,
-                gross_gain=total_gain_brl,
-                accumulated_loss_before=acc_loss,
-                taxable_gain=taxable,
-                tax_rate=rate,
-                tax_due=tax_due,
-                irrf_withheld=irrf,
-                darf_to_pay=darf,
-                accumulated_loss_after=ZERO,
-            ))
+            irrf = self._IRRF[trade_type](total_proceeds_brl, total_gain_brl)
+
+            darf = max(tax_due - irrf, ZERO)
+
+            emit(taxable, tax_due, irrf, darf, acc_after=ZERO)
 
         return results
 
     # ── helpers ────────────────────────────────────────────────────────
 
+    # IRRF (dedo-duro), per trade type
+
     @staticmethod
-    def _rate(trade_type: TradeType) -> Decimal:
-        return DAY_TRADE_RATE if trade_type == TradeType.DAY_TRADE else SWING_TRADE_RATE
+    def _irrf_swing_trade(
+        total_proceeds_brl: Decimal, total_gain_brl: Decimal,
+    ) -> Decimal:
+        """Swing Trade: 0,005 % sobre valor da venda."""
+        return round_monetary(total_proceeds_brl * IRRF_SWING_RATE)
 
     @staticmethod
-    def _compute_irrf(
-        trade_type: TradeType,
-        total_proceeds_brl: Decimal,
-        total_gain_brl: Decimal,
+    def _irrf_day_trade(
+        total_proceeds_brl: Decimal, total_gain_brl: Decimal,
     ) -> Decimal:
-        """IRRF (dedo-duro):
-        - Swing Trade: 0,005 % sobre valor da venda.
-        - Day Trade:   1 % sobre o ganho líquido (se positivo).
-        """
-        if trade_type == TradeType.DAY_TRADE:
-            if total_gain_brl > ZERO:
-                return round_monetary(total_gain_brl * IRRF_DAY_RATE)
-            return ZERO
-        else:
-            return round_monetary(total_proceeds_brl * IRRF_SWING_RATE)
+        """Day Trade: 1 % sobre o ganho líquido (se positivo)."""
+        if total_gain_brl > ZERO:
+            return round_monetary(total_gain_brl * IRRF_DAY_RATE)
+        return ZERO
+
+    _RATES = {
+        TradeType.SWING_TRADE: SWING_TRADE_RATE,
+        TradeType.DAY_TRADE: DAY_TRADE_RATE,
+    }
+    _IRRF = {
+        TradeType.SWING_TRADE: _irrf_swing_trade,
+        TradeType.DAY_TRADE: _irrf_day_trade,
+    }
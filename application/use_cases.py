@@ -8,10 +8,11 @@ import logging
 from collections import defaultdict
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Optional
+from operator import itemgetter
+from typing import Iterator, Optional
 
 from domain.entities import (
-    PortfolioCustodian, Position, Transaction, TaxResult,
+    PortfolioCustodian, Position, TaxLoss, Transaction, TaxResult,
 )
 from domain.enums import (
     AssetClass, Currency, TradeType, TransactionType,
@@ -20,6 +21,7 @@ from domain.value_objects import round_monetary, to_decimal
 from application.position_calculator import PositionCalculator, SaleResult
 from application.tax_calculator import TaxCalculatorBR
 from infrastructure.repositories import (
+    AuditLogRepository,
     CustodianRepository,
     PositionRepository,
     SettingsRepository,
@@ -32,13 +34,39 @@ log = logging.getLogger(__name__)
 ZERO = Decimal("0")
 
 
+def _parse_dmy(raw: str) -> date:
+    """Parse a DD/MM/YYYY date.
+
+    Same result as ``datetime.strptime(raw, "%d/%m/%Y").date()`` for the
+    dates found in B3 exports, without strptime's per-call regex and
+    locale machinery.
+    """
+    day, month, year = raw.split("/")
+    digits = day + month + year
+    if not (
+        len(day) <= 2 and len(month) <= 2 and len(year) == 4
+        and digits.isascii() and digits.isdigit()
+    ):
+        raise ValueError(f"time data {raw!r} does not match format '%d/%m/%Y'")
+    return date(int(year), int(month), int(day))
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # RebuildAll
 # ═══════════════════════════════════════════════════════════════════════════
 
 class RebuildAllUseCase:
     """Drops position cache & tax losses, then reprocesses everything
-    from the transactions table (the single source of truth)."""
+    from the transactions table (the single source of truth).
+
+    ``execute`` always replays the whole history, so it also repairs
+    inconsistent derived tables. Callers that only appended transactions
+    can opt into ``execute_incremental`` instead.
+    """
+
+    # Settings keys for the incremental-rebuild watermark
+    _AUDIT_WATERMARK_KEY = "last_rebuild_audit_id"
+    _LAST_TX_DATE_KEY = "last_rebuild_tx_date"
 
     def execute(self, session) -> dict:
         """Returns summary dict with counts."""
@@ -46,57 +74,168 @@ class RebuildAllUseCase:
         PositionRepository.clear_all(session)
         TaxLossRepository.clear_all(session)
 
-        # 2. Load all transactions ordered by date
-        transactions = TransactionRepository.get_all(session)
-        if not transactions:
-            return {"transactions": 0, "positions": 0, "tax_results": 0}
-
-        # 3. Rebuild positions via PositionCalculator
+        # 2-3. Stream all transactions, ordered by date, through the
+        # PositionCalculator; only the sale results are kept in memory
         calc = PositionCalculator()
+        process = calc.process
         sale_results: list[SaleResult] = []
-        for tx in transactions:
-            sr = calc.process(tx)
+        tx_count = 0
+        tx = None
+        for tx in TransactionRepository.iter_all(session):
+            tx_count += 1
+            sr = process(tx)
             if sr is not None:
                 sale_results.append(sr)
+        if tx is None:
+            return {"transactions": 0, "positions": 0, "tax_results": 0}
 
         # Persist positions
-        for pos in calc.get_positions():
-            PositionRepository.upsert(session, pos)
+        positions = calc.get_positions()
+        PositionRepository.bulk_upsert(session, positions)
 
         # 4. Rebuild custodians
-        custodians = self._build_custodians(calc.get_open_positions())
+        custodians = self._build_custodians([p for p in positions if p.is_open])
         CustodianRepository.rebuild(session, custodians)
 
         # 5. Rebuild tax losses month by month
+        tax_results_total = self._persist_tax_losses(session, sale_results, {})
+
+        # 6. Store rebuild timestamp and watermark
+        self._store_watermark(session, tx.date)
+
+        return {
+            "transactions": tx_count,
+            "positions": len(positions),
+            "tax_results": tax_results_total,
+        }
+
+    def execute_incremental(self, session) -> dict:
+        """Fold transactions appended since the last rebuild into the
+        derived tables, falling back to a full replay when needed.
+
+        Assumes the derived tables are consistent; use ``execute`` to
+        repair them.
+        """
+        summary = self._execute_incremental(session)
+        if summary is not None:
+            return summary
+        return self.execute(session)
+
+    def _execute_incremental(self, session) -> Optional[dict]:
+        """Fold transactions inserted since the last rebuild into the
+        derived tables; return None when a full replay is required.
+
+        Positions only depend on their own ticker's history and tax
+        results on their (asset_class, trade_type) group, so appending is
+        equivalent to a full replay as long as no transaction was edited
+        or deleted, none is dated before the last rebuilt one, and no new
+        sale falls in a month whose tax result is already stored.
+        """
+        watermark = SettingsRepository.get(session, self._AUDIT_WATERMARK_KEY)
+        last_date = SettingsRepository.get(session, self._LAST_TX_DATE_KEY)
+        if not watermark or not last_date:
+            return None
+
+        changes = AuditLogRepository.get_actions_since(
+            session, "transactions", int(watermark)
+        )
+        if any(action != "INSERT" for action, _ in changes):
+            return None
+        if not changes:
+            return {"transactions": 0, "positions": 0, "tax_results": 0}
+
+        new_ids = {record_id for _, record_id in changes}
+        new_txs = TransactionRepository.get_by_ids(session, list(new_ids))
+        last_date = date.fromisoformat(last_date)
+        if len(new_txs) != len(new_ids) or new_txs[0].date < last_date:
+            return None
+
+        acc_losses: dict[tuple[AssetClass, TradeType], Decimal] = {}
+        for tx in new_txs:
+            if tx.type != TransactionType.SELL:
+                continue
+            key = (tx.asset_class, tx.trade_type)
+            if key not in acc_losses:
+                latest = TaxLossRepository.get_latest_month(session, *key)
+                if latest is not None and tx.date.strftime("%Y-%m") <= latest:
+                    return None
+                acc_losses[key] = TaxLossRepository.get_latest(session, *key)
+
+        # Replay the affected tickers, keeping only the new sales
+        calc = PositionCalculator()
+        sale_results: list[SaleResult] = []
+        tickers = sorted({tx.ticker for tx in new_txs})
+        for tx in TransactionRepository.get_by_tickers(session, tickers):
+            sr = calc.process(tx)
+            if sr is not None and tx.id in new_ids:
+                sale_results.append(sr)
+
+        positions = calc.get_positions()
+        PositionRepository.bulk_upsert(session, positions)
+
+        custodians = self._build_custodians(positions)
+        CustodianRepository.replace_for_tickers(session, tickers, custodians)
+
+        tax_results_total = self._persist_tax_losses(
+            session, sale_results, acc_losses
+        )
+        self._store_watermark(session, new_txs[-1].date)
+
+        log.info(
+            "Incremental rebuild: %d new transaction(s) over %d ticker(s)",
+            len(new_txs), len(tickers),
+        )
+        return {
+            "transactions": len(new_txs),
+            "positions": len(positions),
+            "tax_results": tax_results_total,
+        }
+
+    @staticmethod
+    def _persist_tax_losses(
+        session,
+        sale_results: list[SaleResult],
+        acc_losses: dict[tuple[AssetClass, TradeType], Decimal],
+    ) -> int:
+        """Run the monthly tax calculation over *sale_results* in month
+        order and upsert the resulting tax losses; returns their count."""
         tax_calc = TaxCalculatorBR()
-        acc_losses: dict[tuple[AssetClass, TradeType], Decimal] = defaultdict(lambda: ZERO)
-        sales_by_month: dict[str, list[SaleResult]] = defaultdict(list)
+        # Bucket by an integer month code (year * 12 + month - 1); the
+        # YYYY-MM string is only formatted once per month
+        sales_by_month: dict[int, list[SaleResult]] = defaultdict(list)
         for sr in sale_results:
-            month = sr.date.strftime("%Y-%m")
-            sales_by_month[month].append(sr)
+            d = sr.date
+            sales_by_month[d.year * 12 + d.month - 1].append(sr)
 
-        tax_results_total = 0
-        for month in sorted(sales_by_month.keys()):
+        losses: list[TaxLoss] = []
+        for code in sorted(sales_by_month):
+            month = f"{code // 12:04d}-{code % 12 + 1:02d}"
             results = tax_calc.calculate_monthly_tax(
-                sales_by_month[month], acc_losses, month
+                sales_by_month[code], acc_losses, month
             )
-            for tr in results:
-                TaxLossRepository.upsert(
-                    session, tr.asset_class, tr.trade_type,
-                    tr.accumulated_loss_after, tr.month_ref,
+            losses.extend(
+                TaxLoss(
+                    asset_class=tr.asset_class,
+                    trade_type=tr.trade_type,
+                    accumulated_loss=tr.accumulated_loss_after,
+                    month_ref=tr.month_ref,
                 )
-                tax_results_total += 1
+                for tr in results
+            )
+        TaxLossRepository.bulk_upsert(session, losses)
+        return len(losses)
 
-        # 6. Store rebuild timestamp
+    def _store_watermark(self, session, last_tx_date: date) -> None:
         SettingsRepository.set(
             session, "last_rebuild", datetime.utcnow().isoformat()
         )
-
-        return {
-            "transactions": len(transactions),
-            "positions": len(calc.get_positions()),
-            "tax_results": tax_results_total,
-        }
+        SettingsRepository.set(
+            session, self._AUDIT_WATERMARK_KEY,
+            str(AuditLogRepository.get_max_id(session, "transactions")),
+        )
+        SettingsRepository.set(
+            session, self._LAST_TX_DATE_KEY, last_tx_date.isoformat()
+        )
 
     @staticmethod
     def _build_custodians(positions: list[Position]) -> list[PortfolioCustodian]:
@@ -118,16 +257,17 @@ class RebuildAllUseCase:
 class SaveTransactionUseCase:
     """Validates and persists a single transaction, updating caches."""
 
-    def __init__(self, tax_strict_mode: bool = False) -> None:
+    def __init__(
+        self, tax_strict_mode: bool = False, quiet: bool = False
+    ) -> None:
         self._strict = tax_strict_mode
+        # Batch callers (imports) set quiet to skip the per-save INFO lines
+        self._quiet = quiet
 
     def execute(self, session, tx: Transaction) -> int:
         """Save (insert or update) a transaction.
         Returns the transaction ID.
         """
-        import logging
-        _log = logging.getLogger(__name__)
-
         # Tax Strict Mode check
         if self._strict and tx.currency == Currency.USD:
             if tx.fx_rate <= ZERO:
@@ -137,8 +277,9 @@ class SaveTransactionUseCase:
                 )
 
         # ── Sell validation (against position AT the sell date) ────────
+        verbose = not self._quiet and log.isEnabledFor(logging.INFO)
         if tx.type == TransactionType.SELL:
-            self._validate_sell_at_date(session, tx, _log)
+            self._validate_sell_at_date(session, tx, verbose)
 
         if tx.id is None:
             tx_id = TransactionRepository.insert(session, tx)
@@ -147,11 +288,15 @@ class SaveTransactionUseCase:
             tx_id = tx.id
 
         # Recalculate positions for this ticker+institution
-        self._recalc_and_update_custody(session, tx.ticker, tx.institution, _log)
+        self._recalc_and_update_custody(
+            session, tx.ticker, tx.institution, verbose
+        )
         return tx_id
 
     @staticmethod
-    def _validate_sell_at_date(session, tx: Transaction, _log) -> None:
+    def _validate_sell_at_date(
+        session, tx: Transaction, verbose: bool = True
+    ) -> None:
         """Validate sell against the position AT the sell date.
 
         We replay all existing transactions for this ticker@institution
@@ -159,16 +304,16 @@ class SaveTransactionUseCase:
         would exist at that point in time.  Then we check if the sell
         quantity is feasible.
         """
-        _log.info(
-            "SELL VALIDATION: %s qty=%s date=%s inst='%s'",
-            tx.ticker, tx.quantity, tx.date, tx.institution,
-        )
+        if verbose:
+            log.info(
+                "SELL VALIDATION: %s qty=%s date=%s inst='%s'",
+                tx.ticker, tx.quantity, tx.date, tx.institution,
+            )
 
-        # Get all existing transactions for this ticker at this institution
-        all_tx = TransactionRepository.get_by_ticker(session, tx.ticker)
-        inst_tx = sorted(
-            [t for t in all_tx if t.institution == tx.institution],
-            key=lambda t: (t.date, t.id or 0),
+        # Get all existing transactions for this ticker at this institution,
+        # already sorted by (date, id)
+        inst_tx = TransactionRepository.get_by_ticker_institution(
+            session, tx.ticker, tx.institution
         )
 
         if not inst_tx:
@@ -180,20 +325,18 @@ class SaveTransactionUseCase:
         # Replay transactions up to the sell date to get position at that point
         calc = PositionCalculator()
         for t in inst_tx:
-            if t.date <= tx.date:
-                calc.process(t)
+            if t.date > tx.date:
+                break  # inst_tx is sorted by date
+            calc.process(t)
 
         # Check the position at the sell date
-        positions = calc.get_positions()
-        pos_qty = ZERO
-        for p in positions:
-            if p.institution == tx.institution:
-                pos_qty = p.quantity
-
-        _log.info(
-            "SELL VALIDATION at date %s: position_qty=%s, sell_qty=%s",
-            tx.date, pos_qty, tx.quantity,
-        )
+        pos_qty = calc.get_quantity(tx.ticker, tx.institution)
+
+        if verbose:
+            log.info(
+                "SELL VALIDATION at date %s: position_qty=%s, sell_qty=%s",
+                tx.date, pos_qty, tx.quantity,
+            )
 
         if pos_qty <= ZERO:
             raise ValueError(
@@ -210,7 +353,7 @@ class SaveTransactionUseCase:
 
     @staticmethod
     def _recalc_and_update_custody(
-        session, ticker: str, institution: str, _log
+        session, ticker: str, institution: str, verbose: bool = True
     ) -> None:
         """Recompute positions for ALL institutions of *ticker* and
         update the custodians table so the custody view is always fresh.
@@ -223,33 +366,29 @@ class SaveTransactionUseCase:
         # all_tx is already sorted by (date, id) from the repository
 
         calc = PositionCalculator()
-        for t in all_tx:
-            calc.process(t)
-
-        for pos in calc.get_positions():
-            PositionRepository.upsert(session, pos)
+        calc.replay(all_tx)
 
-        _log.info(
-            "Recalculated %d position(s) for ticker %s",
-            len(calc.get_positions()), ticker,
-        )
+        positions = calc.get_positions()
+        PositionRepository.bulk_upsert(session, positions)
 
-        # Also rebuild custodians for ALL tickers (keeps custody view fresh)
-        all_positions = PositionRepository.get_open(session)
-        custodians = []
-        for p in all_positions:
-            custodians.append(
-                PortfolioCustodian(
-                    ticker=p.ticker,
-                    institution=p.institution,
-                    quantity=p.quantity,
-                )
+        # Refresh the custodians of this ticker (keeps custody view fresh);
+        # other tickers' positions are unchanged, so their rows are too
+        custodians = [
+            PortfolioCustodian(
+                ticker=p.ticker,
+                institution=p.institution,
+                quantity=p.quantity,
+            )
+            for p in positions
+            if p.is_open
+        ]
+        CustodianRepository.replace_for_tickers(session, [ticker], custodians)
+        if verbose:
+            log.info(
+                "Recalculated %d position(s) and %d custodian record(s) "
+                "after saving %s@%s",
+                len(positions), len(custodians), ticker, institution,
             )
-        CustodianRepository.rebuild(session, custodians)
-        _log.info(
-            "Updated %d custodian record(s) after saving %s@%s",
-            len(custodians), ticker, institution,
-        )
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -264,56 +403,113 @@ class ImportB3CsvUseCase:
         "Quantidade", "Preço", "Valor",
     }
 
+    # Columns read from each CSV row, with the value used when absent
+    _COLUMNS = (
+        ("Data do Negócio", ""),
+        ("Tipo de Movimentação", ""),
+        ("Código de Negociação", ""),
+        ("Quantidade", "0"),
+        ("Preço", "0"),
+        ("Instituição", ""),
+    )
+
+    PREVIEW_BATCH = 1000
+
     def parse_preview(self, file_path: str) -> list[Transaction]:
         """Parse CSV and return unsaved Transaction objects for preview."""
         transactions: list[Transaction] = []
+        for batch in self.iter_preview(file_path):
+            transactions.extend(batch)
+        return transactions
+
+    def iter_preview(
+        self, file_path: str, batch_size: int = PREVIEW_BATCH,
+    ) -> Iterator[list[Transaction]]:
+        """Parse CSV lazily, yielding the transactions in batches of up to
+        *batch_size* so a preview can start showing rows before the whole
+        file has been read."""
         with open(file_path, "r", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f, delimiter=";")
+            reader = csv.reader(f, delimiter=";")
+            header = next(reader, None)
+            if header is None:
+                return
+            get_fields = self._field_getter(header)
+            batch: list[Transaction] = []
             for row in reader:
+                if not row:
+                    continue  # blank line
                 try:
-                    tx = self._row_to_transaction(row)
-                    transactions.append(tx)
+                    batch.append(self._row_to_transaction(get_fields(row)))
                 except Exception as e:
                     log.warning("Skipping CSV row: %s — %s", row, e)
-        return transactions
+                    continue
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
+    @classmethod
+    def _field_getter(cls, header: list[str]):
+        """Return a callable extracting the _COLUMNS fields from a row.
+
+        Column positions are resolved once per file, so rows are read as
+        plain lists instead of building a dict per row (csv.DictReader).
+        """
+        positions = {name: i for i, name in enumerate(header)}
+        if all(name in positions for name, _ in cls._COLUMNS):
+            return itemgetter(*(positions[name] for name, _ in cls._COLUMNS))
+        lookups = [(positions.get(name), default) for name, default in cls._COLUMNS]
+        return lambda row: tuple(
+            row[i] if i is not None else default for i, default in lookups
+        )
 
     def persist(self, session, transactions: list[Transaction]) -> int:
         """Persist confirmed transactions. Returns count of inserted."""
-        count = 0
-        for tx in transactions:
-            TransactionRepository.insert(session, tx)
-            count += 1
-        return count
+        inserted = len(TransactionRepository.insert_many(session, transactions))
+        # One aggregated line per batch rather than one per row
+        if log.isEnabledFor(logging.INFO):
+            log.info("Imported %d transaction(s) from CSV", inserted)
+        return inserted
 
     @staticmethod
-    def _row_to_transaction(row: dict) -> Transaction:
-        """Convert a CSV row dict to a Transaction entity."""
-        raw_date = row.get("Data do Negócio", "").strip()
-        tx_date = datetime.strptime(raw_date, "%d/%m/%Y").date()
+    def _row_to_transaction(
+        fields: tuple[str, ...], *,
+        BUY=TransactionType.BUY, SELL=TransactionType.SELL,
+        ACAO=AssetClass.ACAO, SWING_TRADE=TradeType.SWING_TRADE,
+        BRL=Currency.BRL, ONE=Decimal("1"),
+    ) -> Transaction:
+        """Convert the _COLUMNS fields of a CSV row to a Transaction.
+
+        The enum members and constants are bound as keyword-only
+        defaults, so each row avoids the Enum class attribute lookups.
+        """
+        raw_date, raw_type, ticker, qty_str, price_str, institution = fields
+        tx_date = _parse_dmy(raw_date.strip())
 
-        raw_type = row.get("Tipo de Movimentação", "").strip().upper()
-        tx_type = TransactionType.BUY if "COMPRA" in raw_type else TransactionType.SELL
+        raw_type = raw_type.strip().upper()
+        tx_type = BUY if "COMPRA" in raw_type else SELL
 
-        ticker = row.get("Código de Negociação", "").strip().upper()
+        ticker = ticker.strip().upper()
 
-        qty_str = row.get("Quantidade", "0").strip().replace(".", "").replace(",", ".")
-        price_str = row.get("Preço", "0").strip().replace(".", "").replace(",", ".")
+        qty_str = qty_str.strip().replace(".", "").replace(",", ".")
+        price_str = price_str.strip().replace(".", "").replace(",", ".")
 
         quantity = to_decimal(qty_str)
         price = to_decimal(price_str)
 
-        institution = row.get("Instituição", "").strip() or "B3"
+        institution = institution.strip() or "B3"
 
         return Transaction(
             ticker=ticker,
-            asset_class=AssetClass.ACAO,  # default; user can adjust
+            asset_class=ACAO,  # default; user can adjust
             type=tx_type,
-            trade_type=TradeType.SWING_TRADE,  # default
+            trade_type=SWING_TRADE,  # default
             date=tx_date,
             quantity=quantity,
             price=price,
-            currency=Currency.BRL,
-            fx_rate=Decimal("1"),
+            currency=BRL,
+            fx_rate=ONE,
             institution=institution,
         )
 
@@ -331,13 +527,10 @@ class DetectCorporateActionUseCase:
     def check_all(self, session) -> list[str]:
         """Returns list of warning messages for suspicious price moves."""
         positions = PositionRepository.get_all(session)
-        warnings: list[str] = []
-        for pos in positions:
-            if pos.quantity <= ZERO or pos.avg_price <= ZERO:
-                continue
-            msg = self._provider.detect_corporate_action(
-                pos.ticker, pos.avg_price
-            )
-            if msg:
-                warnings.append(msg)
-        return warnings
+        expected = [
+            (pos.ticker, pos.avg_price)
+            for pos in positions
+            if pos.quantity > ZERO and pos.avg_price > ZERO
+        ]
+        # One price lookup per distinct ticker, not one per position
+        return self._provider.detect_corporate_actions(expected)
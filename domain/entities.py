@@ -2,21 +2,23 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
 from datetime import date, datetime
 from decimal import Decimal
 from typing import Optional
 
 from domain.enums import AssetClass, Currency, TradeType, TransactionType
 from domain.value_objects import (
+    ZERO,
     Quantity,
-    compute_consistency_hash,
+    hash_canonical_json,
+    json_quote,
     round_monetary,
     to_decimal,
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     """A single portfolio transaction — the canonical source of truth."""
 
@@ -34,8 +36,20 @@ class Transaction:
     id: Optional[int] = None
     consistency_hash: str = ""
     created_at: Optional[datetime] = None
-
-    def __post_init__(self) -> None:
+    # True when built from a trusted DB row whose values are already
+    # Decimals at column precision; skips the normalization below.
+    _normalized: InitVar[bool] = False
+    # total_value / total_value_brl, computed on first access
+    _total_value: Optional[Decimal] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _total_value_brl: Optional[Decimal] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self, _normalized: bool) -> None:
+        if _normalized:
+            return
         self.quantity = to_decimal(self.quantity)
         self.price = round_monetary(to_decimal(self.price))
         self.fx_rate = to_decimal(self.fx_rate)
@@ -43,35 +57,40 @@ class Transaction:
     @property
     def total_value(self) -> Decimal:
         """Gross value = quantity × price."""
-        return round_monetary(self.quantity * self.price)
+        if self._total_value is None:
+            self._total_value = round_monetary(self.quantity * self.price)
+        return self._total_value
 
     @property
     def total_value_brl(self) -> Decimal:
         """Total value converted to BRL."""
-        return round_monetary(self.total_value * self.fx_rate)
+        if self._total_value_brl is None:
+            self._total_value_brl = round_monetary(self.total_value * self.fx_rate)
+        return self._total_value_brl
 
     def compute_hash(self) -> str:
         """Return the SHA-256 consistency hash for this transaction."""
-        data = {
-            "ticker": self.ticker,
-            "asset_class": self.asset_class,
-            "type": self.type,
-            "trade_type": self.trade_type,
-            "date": self.date,
-            "quantity": self.quantity,
-            "price": self.price,
-            "currency": self.currency,
-            "fx_rate": self.fx_rate,
-            "institution": self.institution,
-        }
-        return compute_consistency_hash(data)
+        # Canonical JSON (sorted keys) written out directly; digest-identical
+        # to compute_consistency_hash() over the same fields.
+        return hash_canonical_json(
+            f'{{"asset_class": "{self.asset_class.value}", '
+            f'"currency": "{self.currency.value}", '
+            f'"date": "{self.date.isoformat()}", '
+            f'"fx_rate": "{self.fx_rate}", '
+            f'"institution": {json_quote(self.institution)}, '
+            f'"price": "{self.price}", '
+            f'"quantity": "{self.quantity}", '
+            f'"ticker": {json_quote(self.ticker)}, '
+            f'"trade_type": "{self.trade_type.value}", '
+            f'"type": "{self.type.value}"}}'
+        )
 
     def seal(self) -> None:
         """Compute and set the consistency hash."""
         self.consistency_hash = self.compute_hash()
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Derived position cache — rebuilt from transactions."""
 
@@ -84,15 +103,18 @@ class Position:
     institution: str
     id: Optional[int] = None
     consistency_hash: str = ""
+    _normalized: InitVar[bool] = False  # see Transaction
 
-    def __post_init__(self) -> None:
+    def __post_init__(self, _normalized: bool) -> None:
+        if _normalized:
+            return
         self.quantity = to_decimal(self.quantity)
         self.avg_price = round_monetary(to_decimal(self.avg_price))
         self.total_cost = round_monetary(to_decimal(self.total_cost))
 
     @property
     def is_open(self) -> bool:
-        return self.quantity > Decimal("0")
+        return self.quantity > ZERO
 
     @property
     def market_key(self) -> str:
@@ -100,22 +122,22 @@ class Position:
         return f"{self.ticker}@{self.institution}"
 
     def compute_hash(self) -> str:
-        data = {
-            "ticker": self.ticker,
-            "asset_class": self.asset_class,
-            "quantity": self.quantity,
-            "avg_price": self.avg_price,
-            "currency": self.currency,
-            "total_cost": self.total_cost,
-            "institution": self.institution,
-        }
-        return compute_consistency_hash(data)
+        # Canonical JSON written out directly, as in Transaction.compute_hash
+        return hash_canonical_json(
+            f'{{"asset_class": "{self.asset_class.value}", '
+            f'"avg_price": "{self.avg_price}", '
+            f'"currency": "{self.currency.value}", '
+            f'"institution": {json_quote(self.institution)}, '
+            f'"quantity": "{self.quantity}", '
+            f'"ticker": {json_quote(self.ticker)}, '
+            f'"total_cost": "{self.total_cost}"}}'
+        )
 
     def seal(self) -> None:
         self.consistency_hash = self.compute_hash()
 
 
-@dataclass
+@dataclass(slots=True)
 class TaxLoss:
     """Accumulated tax losses carried forward, per asset class + trade type."""
 
@@ -129,7 +151,7 @@ class TaxLoss:
         self.accumulated_loss = round_monetary(to_decimal(self.accumulated_loss))
 
 
-@dataclass
+@dataclass(slots=True)
 class PortfolioCustodian:
     """Which broker/bank holds each asset."""
 
@@ -142,7 +164,7 @@ class PortfolioCustodian:
         self.quantity = to_decimal(self.quantity)
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditLogEntry:
     """Immutable audit record for every DB mutation."""
 
@@ -155,7 +177,7 @@ class AuditLogEntry:
     id: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TaxResult:
     """Result of monthly tax calculation."""
 
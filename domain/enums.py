@@ -3,6 +3,32 @@
 from enum import Enum
 
 
+# Display labels, built once at import rather than per property access
+_ASSET_CLASS_LABELS = {
+    "ACAO": "Ações",
+    "FII": "Fundos Imobiliários",
+    "ETF": "ETFs",
+    "BDR": "BDRs",
+    "RENDA_FIXA": "Renda Fixa",
+    "CRIPTO": "Criptomoedas",
+}
+
+_TRANSACTION_TYPE_LABELS = {
+    "BUY": "Compra",
+    "SELL": "Venda",
+    "SPLIT": "Desdobramento",
+    "INPLIT": "Grupamento",
+    "DIVIDEND": "Dividendo",
+    "JCP": "JCP",
+    "BONUS": "Bonificação",
+}
+
+_CURRENCY_SYMBOLS = {
+    "BRL": "R$",
+    "USD": "US$",
+}
+
+
 class AssetClass(str, Enum):
     """Classification of financial assets."""
     ACAO = "ACAO"
@@ -14,15 +40,7 @@ class AssetClass(str, Enum):
 
     @property
     def label(self) -> str:
-        _labels = {
-            "ACAO": "Ações",
-            "FII": "Fundos Imobiliários",
-            "ETF": "ETFs",
-            "BDR": "BDRs",
-            "RENDA_FIXA": "Renda Fixa",
-            "CRIPTO": "Criptomoedas",
-        }
-        return _labels[self.value]
+        return _ASSET_CLASS_LABELS[self.value]
 
 
 class TransactionType(str, Enum):
@@ -37,16 +55,7 @@ class TransactionType(str, Enum):
 
     @property
     def label(self) -> str:
-        _labels = {
-            "BUY": "Compra",
-            "SELL": "Venda",
-            "SPLIT": "Desdobramento",
-            "INPLIT": "Grupamento",
-            "DIVIDEND": "Dividendo",
-            "JCP": "JCP",
-            "BONUS": "Bonificação",
-        }
-        return _labels.get(self.value, self.value)
+        return _TRANSACTION_TYPE_LABELS.get(self.value, self.value)
 
 
 class TradeType(str, Enum):
@@ -62,4 +71,4 @@ class Currency(str, Enum):
 
     @property
     def symbol(self) -> str:
-        return "R$" if self == Currency.BRL else "US$"
+        return _CURRENCY_SYMBOLS[self.value]
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+from json.encoder import encode_basestring_ascii as json_quote
 from dataclasses import dataclass
 from decimal import Decimal, ROUND_HALF_UP, InvalidOperation
 from typing import Any
@@ -18,21 +19,25 @@ from domain.enums import Currency
 MONETARY_PRECISION = Decimal("0.01")        # 2 decimal places
 FX_PRECISION = Decimal("0.00000001")        # 8 decimal places
 QTY_PRECISION = Decimal("0.00000001")       # 8 decimal places
+ZERO = Decimal("0")
+
+# NOTE: the rounding mode is passed positionally — Decimal.quantize takes
+# the keyword path noticeably slower, and these helpers run per entity.
 
 
 def round_monetary(value: Decimal) -> Decimal:
     """Round a monetary value to 2 decimal places using ROUND_HALF_UP."""
-    return value.quantize(MONETARY_PRECISION, rounding=ROUND_HALF_UP)
+    return value.quantize(MONETARY_PRECISION, ROUND_HALF_UP)
 
 
 def round_fx(value: Decimal) -> Decimal:
     """Round an FX rate to 8 decimal places using ROUND_HALF_UP."""
-    return value.quantize(FX_PRECISION, rounding=ROUND_HALF_UP)
+    return value.quantize(FX_PRECISION, ROUND_HALF_UP)
 
 
 def round_qty(value: Decimal) -> Decimal:
     """Round a quantity to 8 decimal places using ROUND_HALF_UP."""
-    return value.quantize(QTY_PRECISION, rounding=ROUND_HALF_UP)
+    return value.quantize(QTY_PRECISION, ROUND_HALF_UP)
 
 
 def to_decimal(value: Any) -> Decimal:
@@ -61,23 +66,34 @@ class Money:
     def __post_init__(self) -> None:
         object.__setattr__(self, "amount", round_monetary(to_decimal(self.amount)))
 
+    @classmethod
+    def _exact(cls, amount: Decimal, currency: Currency) -> Money:
+        """Build a Money whose *amount* is already at 2 decimal places
+        (sums/negations of Money amounts), skipping __post_init__."""
+        m = object.__new__(cls)
+        object.__setattr__(m, "amount", amount)
+        object.__setattr__(m, "currency", currency)
+        return m
+
     # Arithmetic ---------------------------------------------------------
     def __add__(self, other: Money) -> Money:
-        self._assert_same_currency(other)
-        return Money(self.amount + other.amount, self.currency)
+        if self.currency is not other.currency:
+            self._assert_same_currency(other)
+        return Money._exact(self.amount + other.amount, self.currency)
 
     def __sub__(self, other: Money) -> Money:
-        self._assert_same_currency(other)
-        return Money(self.amount - other.amount, self.currency)
+        if self.currency is not other.currency:
+            self._assert_same_currency(other)
+        return Money._exact(self.amount - other.amount, self.currency)
 
     def __mul__(self, factor: Decimal | int | float) -> Money:
         return Money(self.amount * to_decimal(factor), self.currency)
 
     def __neg__(self) -> Money:
-        return Money(-self.amount, self.currency)
+        return Money._exact(-self.amount, self.currency)
 
     def __abs__(self) -> Money:
-        return Money(abs(self.amount), self.currency)
+        return Money._exact(abs(self.amount), self.currency)
 
     # Comparison ---------------------------------------------------------
     def __lt__(self, other: Money) -> bool:
@@ -98,19 +114,19 @@ class Money:
 
     @property
     def is_zero(self) -> bool:
-        return self.amount == Decimal("0")
+        return self.amount == ZERO
 
     @property
     def is_positive(self) -> bool:
-        return self.amount > Decimal("0")
+        return self.amount > ZERO
 
     @property
     def is_negative(self) -> bool:
-        return self.amount < Decimal("0")
+        return self.amount < ZERO
 
     @staticmethod
     def zero(currency: Currency) -> Money:
-        return Money(Decimal("0"), currency)
+        return Money(ZERO, currency)
 
     def _assert_same_currency(self, other: Money) -> None:
         if self.currency != other.currency:
@@ -157,11 +173,11 @@ class Quantity:
 
     @property
     def is_zero(self) -> bool:
-        return self.value == Decimal("0")
+        return self.value == ZERO
 
     @staticmethod
     def zero() -> Quantity:
-        return Quantity(Decimal("0"))
+        return Quantity(ZERO)
 
     def __repr__(self) -> str:
         return f"Qty({self.value})"
@@ -188,20 +204,38 @@ class FxRate:
 # Consistency Hash
 # ---------------------------------------------------------------------------
 
+def _canonical_default(obj: Any) -> Any:
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if hasattr(obj, "value"):  # Enum
+        return obj.value
+    if hasattr(obj, "isoformat"):  # date/datetime
+        return obj.isoformat()
+    raise TypeError(f"Cannot serialize {type(obj)}")
+
+
+# Built once: json.dumps() with non-default options constructs a new
+# encoder on every call.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, default=_canonical_default)
+
+
 def compute_consistency_hash(data: dict) -> str:
     """Compute SHA-256 of a canonical JSON representation.
 
     Keys are sorted, Decimals are serialized as strings to ensure
-    determinism across platforms.
+    determinism across platforms.  Callers on hot paths may pass values
+    already converted to str (Decimal → str(d), date → isoformat()) —
+    the digest is identical and the encoder never falls back to Python.
+    """
+    canonical = _CANONICAL_ENCODER.encode(data)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def hash_canonical_json(canonical: str) -> str:
+    """SHA-256 of a document already in compute_consistency_hash's
+    canonical form (sorted keys, default separators, ASCII escapes).
+
+    Entities with a fixed field set build that text directly — string
+    fields quoted with ``json_quote`` — and skip the dict and encoder.
     """
-    def _default(obj: Any) -> Any:
-        if isinstance(obj, Decimal):
-            return str(obj)
-        if hasattr(obj, "value"):  # Enum
-            return obj.value
-        if hasattr(obj, "isoformat"):  # date/datetime
-            return obj.isoformat()
-        raise TypeError(f"Cannot serialize {type(obj)}")
-
-    canonical = json.dumps(data, sort_keys=True, default=_default)
     return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
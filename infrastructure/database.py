@@ -5,11 +5,12 @@ from __future__ import annotations
 import os
 from datetime import date, datetime
 from decimal import Decimal
+from pathlib import Path
 from typing import Optional
 
 from sqlalchemy import (
     Column, Date, DateTime, Enum as SAEnum, Integer, Numeric, String, Text,
-    create_engine, event, Index,
+    create_engine, event, func, insert, inspect, select, Index,
 )
 from sqlalchemy.orm import (
     DeclarativeBase, Mapped, Session, mapped_column, sessionmaker,
@@ -50,6 +51,7 @@ class TransactionModel(Base):
 
     __table_args__ = (
         Index("ix_transactions_ticker_date", "ticker", "date"),
+        Index("ix_transactions_ticker_inst_date", "ticker", "institution", "date"),
     )
 
 
@@ -67,7 +69,8 @@ class PositionModel(Base):
     consistency_hash: Mapped[str] = mapped_column(String(64), nullable=False, default="")
 
     __table_args__ = (
-        Index("ix_positions_ticker_inst", "ticker", "institution"),
+        # unique: PositionRepository.bulk_upsert relies on ON CONFLICT
+        Index("uq_positions_ticker_inst", "ticker", "institution", unique=True),
     )
 
 
@@ -81,7 +84,10 @@ class TaxLossModel(Base):
     month_ref: Mapped[str] = mapped_column(String(7), nullable=False)  # YYYY-MM
 
     __table_args__ = (
-        Index("ix_tax_losses_ref", "asset_class", "trade_type", "month_ref"),
+        Index(
+            "uq_tax_losses_ref", "asset_class", "trade_type", "month_ref",
+            unique=True,
+        ),
     )
 
 
@@ -126,6 +132,72 @@ class InstitutionModel(Base):
     active: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
 
 
+# ---------------------------------------------------------------------------
+# Audit buffer
+# ---------------------------------------------------------------------------
+
+# session.info key holding audit rows not yet written (see log_action)
+AUDIT_BUFFER_KEY = "audit_buffer"
+
+
+def flush_audit_buffer(session: Session) -> None:
+    """Write the session's buffered audit rows with one executemany."""
+    rows = session.info.pop(AUDIT_BUFFER_KEY, None)
+    if rows:
+        session.execute(insert(AuditLogModel), rows)
+
+
+@event.listens_for(Session, "before_commit")
+def _flush_audit_on_commit(session: Session) -> None:
+    flush_audit_buffer(session)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_audit_on_rollback(session: Session, previous_transaction) -> None:
+    session.info.pop(AUDIT_BUFFER_KEY, None)
+
+
+# Bumped after every commit, so query-result caches can tell whether the
+# data they were built from may have changed
+_data_version = 0
+
+
+def data_version() -> int:
+    return _data_version
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_data_version(session: Session) -> None:
+    global _data_version
+    _data_version += 1
+    session.info.pop(WROTE_KEY, None)
+
+
+# session.info flag: the session has written in its open transaction, so
+# what it reads is not (yet) committed data
+WROTE_KEY = "uncommitted_writes"
+
+
+def has_uncommitted_writes(session: Session) -> bool:
+    return session.info.get(WROTE_KEY, False)
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flushed_writes(session: Session, flush_context) -> None:
+    session.info[WROTE_KEY] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_executed_writes(state) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info[WROTE_KEY] = True
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_writes_on_rollback(session: Session) -> None:
+    session.info.pop(WROTE_KEY, None)
+
+
 # ---------------------------------------------------------------------------
 # Engine and session factory
 # ---------------------------------------------------------------------------
@@ -139,11 +211,28 @@ def get_db_path() -> str:
 
 
 def _set_wal_mode(dbapi_conn, connection_record):
-    """Enable WAL journal mode for better concurrency."""
+    """Enable WAL journal mode and tune the connection for read-heavy use."""
     cursor = dbapi_conn.cursor()
     cursor.execute("PRAGMA journal_mode=WAL")
     cursor.execute("PRAGMA synchronous=NORMAL")
     cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA cache_size=-65536")       # 64 MB page cache
+    cursor.execute("PRAGMA mmap_size=268435456")     # 256 MB memory map
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA busy_timeout=5000")       # ms, UI reads vs. writer
+    # Analyze only what looks stale, as SQLite recommends on open
+    cursor.execute("PRAGMA optimize=0x10002")
+    cursor.close()
+
+
+def _set_memory_pragmas(dbapi_conn, connection_record):
+    """In-memory databases (tests) have no journal file to put in WAL
+    mode; keep the rest of the file tuning and drop syncing entirely."""
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA temp_store=MEMORY")
     cursor.close()
 
 
@@ -155,15 +244,93 @@ def create_db_engine(db_path: str | None = None):
         os.makedirs(os.path.dirname(path), exist_ok=True)
     url = "sqlite:///:memory:" if is_memory else f"sqlite:///{path}"
     engine = create_engine(url, echo=False)
-    if not is_memory:
-        event.listen(engine, "connect", _set_wal_mode)
+    event.listen(
+        engine, "connect", _set_memory_pragmas if is_memory else _set_wal_mode
+    )
+    # pysqlite only emits BEGIN before DML, so a SAVEPOINT would open (and
+    # its RELEASE commit) the transaction; let SQLAlchemy emit BEGIN
+    # itself so session.begin_nested() nests as expected.  Every session
+    # statement, PRAGMA and ANALYZE included, then runs in a transaction
+    # that must be committed to persist; the connect hooks above run
+    # before any BEGIN
+    event.listen(engine, "connect", _disable_pysqlite_begin)
+    event.listen(engine, "begin", _emit_begin)
+    return engine
+
+
+def _disable_pysqlite_begin(dbapi_conn, connection_record):
+    dbapi_conn.isolation_level = None
+
+
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+def _set_read_pragmas(dbapi_conn, connection_record):
+    """Tune a read-only connection; journal and sync modes are the writer's."""
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA query_only=ON")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
+
+def create_read_engine(db_path: str | None = None):
+    """Create a read-only engine for UI queries, separate from the writer.
+
+    Connections open the file with ``mode=ro``, so reads never contend
+    for the write connection of the WriteQueueManager.  An in-memory
+    database cannot be shared across engines; callers should keep using
+    the write engine for it.
+    """
+    path = db_path or _DB_PATH
+    if path == ":memory:":
+        raise ValueError("An in-memory database has no read-only engine")
+    url = f"sqlite:///{Path(path).resolve().as_uri()}?mode=ro&uri=true"
+    engine = create_engine(
+        url, echo=False, connect_args={"check_same_thread": False}
+    )
+    event.listen(engine, "connect", _set_read_pragmas)
     return engine
 
 
 def create_tables(engine) -> None:
-    """Create all tables if they don't exist."""
+    """Create all tables if they don't exist.
+
+    create_all() skips tables that already exist, including indexes added
+    to them later, so those are created individually.  Before a unique
+    index is added to an existing table, duplicate keys are dropped,
+    keeping the most recently written row.
+    """
     Base.metadata.create_all(engine)
+    for table in Base.metadata.sorted_tables:
+        existing = {ix["name"] for ix in inspect(engine).get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            if index.unique:
+                _drop_duplicate_keys(engine, table, index)
+            index.create(engine)
+
+
+def _drop_duplicate_keys(engine, table, index) -> None:
+    keep = (
+        select(func.max(table.c.id))
+        .group_by(*index.columns)
+        .scalar_subquery()
+    )
+    with engine.begin() as conn:
+        conn.execute(table.delete().where(table.c.id.not_in(keep)))
 
 
 def make_session_factory(engine) -> sessionmaker:
-    return sessionmaker(bind=engine, expire_on_commit=False)
+    # Repositories flush explicitly after each ORM mutation (or write via
+    # Core), so queries need not autoflush the identity map
+    return sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+
+def make_read_session_factory(engine) -> sessionmaker:
+    """Session factory for a read-only engine (nothing to flush)."""
+    return sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
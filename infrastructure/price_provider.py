@@ -2,13 +2,26 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import time
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import Optional
+from typing import Iterable, Optional, Sequence
+
+from domain.value_objects import round_monetary
 
 log = logging.getLogger(__name__)
 
+# Seconds a fetched yfinance fast_info is reused before refetching
+_FAST_INFO_TTL = 60.0
+
+
+def _to_price(value: float) -> Decimal:
+    """Quote (float) -> Decimal cents, ROUND_HALF_UP like every other
+    monetary value, without the round()/str() round-trip."""
+    return round_monetary(Decimal(value))
+
 
 class PriceProvider(ABC):
     """Abstract interface for fetching market prices."""
@@ -21,34 +34,59 @@ class PriceProvider(ABC):
     def get_previous_close(self, ticker: str) -> Optional[Decimal]:
         """Return the previous closing price for *ticker*."""
 
+    def get_last_prices(
+        self, tickers: Iterable[str]
+    ) -> dict[str, Optional[Decimal]]:
+        """Return the last price of each distinct ticker in *tickers*.
+
+        The default fetches them one by one; providers with a multi-ticker
+        endpoint should override this.
+        """
+        return {t: self.get_last_price(t) for t in dict.fromkeys(tickers)}
+
 
 class YahooFinanceProvider(PriceProvider):
     """Real Yahoo Finance provider using yfinance library."""
 
     def __init__(self) -> None:
         try:
-            import yfinance  # noqa: F401
+            import yfinance
+            self._yf = yfinance  # bound once; no per-call import
             self._available = True
         except ImportError:
+            self._yf = None
             self._available = False
             log.warning("yfinance not installed — price fetching disabled")
+        # ticker -> (monotonic fetch time, yfinance FastInfo)
+        self._fast_info: dict[str, tuple[float, object]] = {}
 
-    def _suffix(self, ticker: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _suffix(ticker: str) -> str:
         """Add .SA suffix for B3 tickers if not already present."""
         if "." in ticker or ticker.endswith("-USD"):
             return ticker
         return f"{ticker}.SA"
 
+    def _get_fast_info(self, ticker: str):
+        """Return the ticker's fast_info, reusing one fetched within
+        _FAST_INFO_TTL so last price and previous close share a request."""
+        now = time.monotonic()
+        cached = self._fast_info.get(ticker)
+        if cached is not None and now - cached[0] < _FAST_INFO_TTL:
+            return cached[1]
+        info = self._yf.Ticker(self._suffix(ticker)).fast_info
+        self._fast_info[ticker] = (now, info)
+        return info
+
     def get_last_price(self, ticker: str) -> Optional[Decimal]:
         if not self._available:
             return None
         try:
-            import yfinance as yf
-            t = yf.Ticker(self._suffix(ticker))
-            info = t.fast_info
+            info = self._get_fast_info(ticker)
             price = getattr(info, "last_price", None)
             if price is not None:
-                return Decimal(str(round(price, 2)))
+                return _to_price(price)
             return None
         except Exception:
             log.exception("Failed to fetch price for %s", ticker)
@@ -58,23 +96,91 @@ class YahooFinanceProvider(PriceProvider):
         if not self._available:
             return None
         try:
-            import yfinance as yf
-            t = yf.Ticker(self._suffix(ticker))
-            info = t.fast_info
+            info = self._get_fast_info(ticker)
             price = getattr(info, "previous_close", None)
             if price is not None:
-                return Decimal(str(round(price, 2)))
+                return _to_price(price)
             return None
         except Exception:
             log.exception("Failed to fetch previous close for %s", ticker)
             return None
 
+    # ── batch form (one HTTP request for all tickers) ──────────────────
+    # The single-ticker methods above remain for callers with one ticker;
+    # anything iterating the portfolio should use this instead.
+
+    def get_last_prices(
+        self, tickers: Iterable[str]
+    ) -> dict[str, Optional[Decimal]]:
+        return self._batch_closes(tickers, super().get_last_prices)
+
+    def _batch_closes(self, tickers, fallback):
+        """Pick the latest daily close of every ticker from a single
+        yf.download; tickers it misses are fetched one by one through
+        *fallback*."""
+        tickers = list(dict.fromkeys(tickers))
+        if not self._available or not tickers:
+            return dict.fromkeys(tickers)
+        try:
+            series = self._download_closes(tickers)
+        except Exception:
+            log.exception("Batch price download failed; fetching one by one")
+            return fallback(tickers)
+        prices: dict[str, Optional[Decimal]] = {}
+        for ticker in tickers:
+            closes = series.get(ticker, [])
+            if closes:
+                prices[ticker] = _to_price(closes[-1])
+        missing = [t for t in tickers if t not in prices]
+        if missing:
+            prices.update(fallback(missing))
+        return prices
+
+    def _download_closes(self, tickers: list[str]) -> dict[str, list[float]]:
+        """Return the recent daily closes (oldest first, gaps dropped) of
+        *tickers*, keyed by ticker, from one yf.download request."""
+        symbols = {self._suffix(t): t for t in tickers}
+        data = self._yf.download(
+            list(symbols), period="5d", progress=False, threads=True,
+            auto_adjust=False, group_by="column",
+        )
+        closes = data["Close"]
+        if closes.ndim == 1:  # older yfinance: a Series for one ticker
+            closes = closes.to_frame(next(iter(symbols)))
+        return {
+            ticker: closes[symbol].dropna().tolist()
+            for symbol, ticker in symbols.items()
+            if symbol in closes
+        }
+
     def detect_corporate_action(
         self, ticker: str, expected_price: Decimal
     ) -> Optional[str]:
         """Check if current price deviates >30% from expected — signals
         a possible split/inplit (corporate action)."""
-        current = self.get_last_price(ticker)
+        return self._corporate_action_message(
+            ticker, expected_price, self.get_last_price(ticker)
+        )
+
+    def detect_corporate_actions(
+        self, expected: Sequence[tuple[str, Decimal]]
+    ) -> list[str]:
+        """Batch form of detect_corporate_action for (ticker, expected
+        price) pairs: prices are fetched once per distinct ticker."""
+        prices = self.get_last_prices(ticker for ticker, _ in expected)
+        warnings: list[str] = []
+        for ticker, expected_price in expected:
+            msg = self._corporate_action_message(
+                ticker, expected_price, prices.get(ticker)
+            )
+            if msg:
+                warnings.append(msg)
+        return warnings
+
+    @staticmethod
+    def _corporate_action_message(
+        ticker: str, expected_price: Decimal, current: Optional[Decimal]
+    ) -> Optional[str]:
         if current is None or expected_price <= 0:
             return None
         ratio = abs(current - expected_price) / expected_price
@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import json
+import weakref
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Optional, Sequence
+from typing import Iterator, Optional, Sequence
 
-from sqlalchemy import delete, select
+from sqlalchemy import (
+    bindparam, delete, func, insert, literal, select, tuple_,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from domain.entities import (
@@ -15,8 +19,9 @@ from domain.entities import (
 )
 from domain.enums import AssetClass, Currency, TradeType, TransactionType
 from infrastructure.database import (
-    AuditLogModel, InstitutionModel, PortfolioCustodianModel, PositionModel,
-    TaxLossModel, TransactionModel,
+    AppSettingsModel, AuditLogModel, InstitutionModel, PortfolioCustodianModel,
+    PositionModel, TaxLossModel, TransactionModel, AUDIT_BUFFER_KEY,
+    data_version, flush_audit_buffer, has_uncommitted_writes,
 )
 
 
@@ -40,10 +45,131 @@ def _tx_model_to_entity(m: TransactionModel) -> Transaction:
         notes=m.notes,
         consistency_hash=m.consistency_hash,
         created_at=m.created_at,
+        _normalized=True,
+    )
+
+
+# Columns in Transaction/Position field order, so a row maps positionally
+_TX_COLUMNS = (
+    TransactionModel.ticker, TransactionModel.asset_class,
+    TransactionModel.type, TransactionModel.trade_type,
+    TransactionModel.date, TransactionModel.quantity, TransactionModel.price,
+    TransactionModel.currency, TransactionModel.fx_rate,
+    TransactionModel.institution, TransactionModel.notes, TransactionModel.id,
+    TransactionModel.consistency_hash, TransactionModel.created_at,
+)
+_POS_COLUMNS = (
+    PositionModel.ticker, PositionModel.asset_class, PositionModel.quantity,
+    PositionModel.avg_price, PositionModel.currency, PositionModel.total_cost,
+    PositionModel.institution, PositionModel.id, PositionModel.consistency_hash,
+)
+
+_ASSET_CLASSES = {m.value: m for m in AssetClass}
+_TX_TYPES = {m.value: m for m in TransactionType}
+_TRADE_TYPES = {m.value: m for m in TradeType}
+_CURRENCIES = {m.value: m for m in Currency}
+
+
+def _tx_row_to_entity(row) -> Transaction:
+    """Build a Transaction from a _TX_COLUMNS row, skipping ORM hydration."""
+    return Transaction(
+        row[0], _ASSET_CLASSES[row[1]], _TX_TYPES[row[2]], _TRADE_TYPES[row[3]],
+        row[4], row[5], row[6], _CURRENCIES[row[7]], *row[8:], True,
+    )
+
+
+def _pos_row_to_entity(row) -> Position:
+    """Build a Position from a _POS_COLUMNS row, skipping ORM hydration."""
+    return Position(
+        row[0], _ASSET_CLASSES[row[1]], row[2], row[3], _CURRENCIES[row[4]],
+        *row[5:], True,
+    )
+
+
+# Fixed-shape reads, built once; callers pass the values as bind params
+_TX_ORDER = (TransactionModel.date, TransactionModel.id)
+_STMT_TX_ALL = select(*_TX_COLUMNS).order_by(*_TX_ORDER)
+_STMT_TX_BY_TICKER = _STMT_TX_ALL.where(
+    TransactionModel.ticker == bindparam("ticker")
+)
+_STMT_TX_BY_TICKER_INST = _STMT_TX_BY_TICKER.where(
+    TransactionModel.institution == bindparam("institution")
+)
+_STMT_TX_BY_TICKERS = _STMT_TX_ALL.where(
+    TransactionModel.ticker.in_(bindparam("tickers", expanding=True))
+)
+_STMT_TX_BY_IDS = _STMT_TX_ALL.where(
+    TransactionModel.id.in_(bindparam("ids", expanding=True))
+)
+_STMT_TX_BY_DATE_RANGE = _STMT_TX_ALL.where(
+    TransactionModel.date.between(bindparam("start"), bindparam("end"))
+)
+_STMT_TX_BY_INSTITUTION = _STMT_TX_ALL.where(
+    TransactionModel.institution == bindparam("institution")
+)
+_STMT_TX_TICKERS = (
+    select(TransactionModel.ticker).distinct().order_by(TransactionModel.ticker)
+)
+_STMT_TX_INSTITUTIONS = (
+    select(TransactionModel.institution)
+    .distinct()
+    .order_by(TransactionModel.institution)
+)
+
+_STMT_POS_ALL = select(*_POS_COLUMNS).order_by(PositionModel.ticker)
+_STMT_POS_OPEN = _STMT_POS_ALL.where(PositionModel.quantity > 0)
+_STMT_POS_BY_TICKER = select(*_POS_COLUMNS).where(
+    PositionModel.ticker == bindparam("ticker")
+)
+_STMT_POS_AT_INST = _STMT_POS_BY_TICKER.where(
+    PositionModel.institution == bindparam("institution")
+)
+
+
+# Upserts keyed on the unique (or primary) key of each table
+def _upsert(model, keys: tuple[str, ...]):
+    stmt = sqlite_insert(model)
+    return stmt.on_conflict_do_update(
+        index_elements=keys,
+        set_={
+            c.name: stmt.excluded[c.name]
+            for c in model.__table__.columns
+            if c.name not in keys and not c.primary_key
+        },
     )
 
 
-def _tx_entity_to_model(e: Transaction) -> TransactionModel:
+_UPSERT_POSITION = _upsert(PositionModel, ("ticker", "institution"))
+_UPSERT_TAX_LOSS = _upsert(TaxLossModel, ("asset_class", "trade_type", "month_ref"))
+_UPSERT_SETTING = _upsert(AppSettingsModel, ("key",))
+
+
+# engine -> {statement: (data version, result)}; see _cached_query.  Weak
+# keys, so a disposed engine's results go with it
+_QUERY_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _cached_query(session: Session, stmt, build) -> list:
+    """Run a scalar-column *stmt* and *build* its result list, reusing the
+    previous result for the same engine while no commit has happened
+    since (data_version).  Reflects committed data only: a session with
+    uncommitted writes always runs the query and never caches it."""
+    if has_uncommitted_writes(session):
+        return build(session.execute(stmt).scalars().all())
+    per_engine = _QUERY_CACHE.setdefault(session.get_bind(), {})
+    version = data_version()
+    cached = per_engine.get(stmt)
+    if cached is None or cached[0] != version:
+        cached = (version, build(session.execute(stmt).scalars().all()))
+        per_engine[stmt] = cached
+    return list(cached[1])
+
+
+def _tx_entity_to_model(
+    e: Transaction, now: Optional[datetime] = None
+) -> TransactionModel:
+    """*now* stamps a new row's created_at; batch callers pass one value
+    instead of calling utcnow() per row."""
     return TransactionModel(
         id=e.id,
         ticker=e.ticker,
@@ -58,21 +184,7 @@ def _tx_entity_to_model(e: Transaction) -> TransactionModel:
         institution=e.institution,
         notes=e.notes,
         consistency_hash=e.consistency_hash,
-        created_at=e.created_at or datetime.utcnow(),
-    )
-
-
-def _pos_model_to_entity(m: PositionModel) -> Position:
-    return Position(
-        id=m.id,
-        ticker=m.ticker,
-        asset_class=AssetClass(m.asset_class),
-        quantity=m.quantity,
-        avg_price=m.avg_price,
-        currency=Currency(m.currency),
-        total_cost=m.total_cost,
-        institution=m.institution,
-        consistency_hash=m.consistency_hash,
+        created_at=e.created_at or now or datetime.utcnow(),
     )
 
 
@@ -102,38 +214,62 @@ class TransactionRepository:
     @staticmethod
     def get_all(session: Session) -> list[Transaction]:
         rows = session.execute(
-            select(TransactionModel).order_by(TransactionModel.date, TransactionModel.id)
-        ).scalars().all()
-        return [_tx_model_to_entity(r) for r in rows]
+            _STMT_TX_ALL, execution_options={"yield_per": 500}
+        )
+        return [_tx_row_to_entity(r) for r in rows]
+
+    @staticmethod
+    def iter_all(session: Session, batch_size: int = 1000) -> Iterator[Transaction]:
+        """Yield every transaction ordered by (date, id), fetching rows in
+        batches so the whole history is never held in memory at once."""
+        result = session.execute(
+            _STMT_TX_ALL, execution_options={"yield_per": batch_size}
+        )
+        for row in result:
+            yield _tx_row_to_entity(row)
 
     @staticmethod
     def get_by_ticker(session: Session, ticker: str) -> list[Transaction]:
+        rows = session.execute(_STMT_TX_BY_TICKER, {"ticker": ticker})
+        return [_tx_row_to_entity(r) for r in rows]
+
+    @staticmethod
+    def get_by_ticker_institution(
+        session: Session, ticker: str, institution: str
+    ) -> list[Transaction]:
         rows = session.execute(
-            select(TransactionModel)
-            .where(TransactionModel.ticker == ticker)
-            .order_by(TransactionModel.date, TransactionModel.id)
-        ).scalars().all()
-        return [_tx_model_to_entity(r) for r in rows]
+            _STMT_TX_BY_TICKER_INST,
+            {"ticker": ticker, "institution": institution},
+        )
+        return [_tx_row_to_entity(r) for r in rows]
+
+    @staticmethod
+    def get_by_tickers(
+        session: Session, tickers: Sequence[str]
+    ) -> list[Transaction]:
+        rows = session.execute(_STMT_TX_BY_TICKERS, {"tickers": list(tickers)})
+        return [_tx_row_to_entity(r) for r in rows]
+
+    @staticmethod
+    def get_by_ids(session: Session, ids: Sequence[int]) -> list[Transaction]:
+        rows = session.execute(_STMT_TX_BY_IDS, {"ids": list(ids)})
+        return [_tx_row_to_entity(r) for r in rows]
 
     @staticmethod
     def get_by_date_range(
         session: Session, start: date, end: date
     ) -> list[Transaction]:
         rows = session.execute(
-            select(TransactionModel)
-            .where(TransactionModel.date.between(start, end))
-            .order_by(TransactionModel.date, TransactionModel.id)
-        ).scalars().all()
-        return [_tx_model_to_entity(r) for r in rows]
+            _STMT_TX_BY_DATE_RANGE, {"start": start, "end": end}
+        )
+        return [_tx_row_to_entity(r) for r in rows]
 
     @staticmethod
     def get_by_institution(session: Session, institution: str) -> list[Transaction]:
         rows = session.execute(
-            select(TransactionModel)
-            .where(TransactionModel.institution == institution)
-            .order_by(TransactionModel.date, TransactionModel.id)
-        ).scalars().all()
-        return [_tx_model_to_entity(r) for r in rows]
+            _STMT_TX_BY_INSTITUTION, {"institution": institution}
+        )
+        return [_tx_row_to_entity(r) for r in rows]
 
     @staticmethod
     def get_by_id(session: Session, tx_id: int) -> Optional[Transaction]:
@@ -142,19 +278,17 @@ class TransactionRepository:
 
     @staticmethod
     def get_distinct_tickers(session: Session) -> list[str]:
-        rows = session.execute(
-            select(TransactionModel.ticker).distinct().order_by(TransactionModel.ticker)
-        ).scalars().all()
-        return list(rows)
+        return _cached_query(
+            session, _STMT_TX_TICKERS,
+            lambda rows: list(rows),
+        )
 
     @staticmethod
     def get_distinct_institutions(session: Session) -> list[str]:
-        rows = session.execute(
-            select(TransactionModel.institution)
-            .distinct()
-            .order_by(TransactionModel.institution)
-        ).scalars().all()
-        return [r for r in rows if r]
+        return _cached_query(
+            session, _STMT_TX_INSTITUTIONS,
+            lambda rows: [r for r in rows if r],
+        )
 
     # ── writes (should be called via WriteQueueManager) ────────────────
 
@@ -170,6 +304,29 @@ class TransactionRepository:
         )
         return model.id
 
+    @staticmethod
+    def insert_many(session: Session, txs: Sequence[Transaction]) -> list[int]:
+        """Insert a batch of transactions with a single flush.
+
+        SQLAlchemy groups the pending rows into one multi-row INSERT
+        (RETURNING the new ids), instead of one round-trip per row.
+        """
+        now = datetime.utcnow()  # one timestamp for the whole batch
+        models = []
+        for tx in txs:
+            tx.seal()
+            model = _tx_entity_to_model(tx, now)
+            model.id = None  # auto-increment
+            models.append(model)
+        session.add_all(models)
+        session.flush()
+        for model in models:
+            AuditLogRepository.log_action(
+                session, "transactions", model.id, "INSERT",
+                new_data=_model_to_json(model), timestamp=now,
+            )
+        return [model.id for model in models]
+
     @staticmethod
     def update(session: Session, tx: Transaction) -> None:
         model = session.get(TransactionModel, tx.id)
@@ -215,27 +372,19 @@ class PositionRepository:
 
     @staticmethod
     def get_all(session: Session) -> list[Position]:
-        rows = session.execute(
-            select(PositionModel).order_by(PositionModel.ticker)
-        ).scalars().all()
-        return [_pos_model_to_entity(r) for r in rows]
+        rows = session.execute(_STMT_POS_ALL)
+        return [_pos_row_to_entity(r) for r in rows]
 
     @staticmethod
     def get_open(session: Session) -> list[Position]:
         """Return only positions with quantity > 0."""
-        rows = session.execute(
-            select(PositionModel)
-            .where(PositionModel.quantity > 0)
-            .order_by(PositionModel.ticker)
-        ).scalars().all()
-        return [_pos_model_to_entity(r) for r in rows]
+        rows = session.execute(_STMT_POS_OPEN)
+        return [_pos_row_to_entity(r) for r in rows]
 
     @staticmethod
     def get_by_ticker(session: Session, ticker: str) -> list[Position]:
-        rows = session.execute(
-            select(PositionModel).where(PositionModel.ticker == ticker)
-        ).scalars().all()
-        return [_pos_model_to_entity(r) for r in rows]
+        rows = session.execute(_STMT_POS_BY_TICKER, {"ticker": ticker})
+        return [_pos_row_to_entity(r) for r in rows]
 
     @staticmethod
     def get_position_at_institution(
@@ -243,12 +392,26 @@ class PositionRepository:
     ) -> Position | None:
         """Return position for a ticker at a specific institution (or None)."""
         row = session.execute(
-            select(PositionModel).where(
-                PositionModel.ticker == ticker,
-                PositionModel.institution == institution,
+            _STMT_POS_AT_INST, {"ticker": ticker, "institution": institution}
+        ).one_or_none()
+        return _pos_row_to_entity(row) if row else None
+
+    @staticmethod
+    def get_positions_bulk(
+        session: Session, pairs: Sequence[tuple[str, str]]
+    ) -> dict[tuple[str, str], Position]:
+        """Return the positions of many (ticker, institution) pairs with
+        one query, keyed by pair; pairs without a position are absent."""
+        if not pairs:
+            return {}
+        rows = session.execute(
+            select(*_POS_COLUMNS).where(
+                tuple_(PositionModel.ticker, PositionModel.institution)
+                .in_(list(pairs))
             )
-        ).scalar_one_or_none()
-        return _pos_model_to_entity(row) if row else None
+        )
+        positions = (_pos_row_to_entity(r) for r in rows)
+        return {(p.ticker, p.institution): p for p in positions}
 
     @staticmethod
     def clear_all(session: Session) -> None:
@@ -257,25 +420,28 @@ class PositionRepository:
 
     @staticmethod
     def upsert(session: Session, pos: Position) -> None:
-        pos.seal()
-        existing = session.execute(
-            select(PositionModel).where(
-                PositionModel.ticker == pos.ticker,
-                PositionModel.institution == pos.institution,
-            )
-        ).scalar_one_or_none()
-        if existing:
-            existing.quantity = pos.quantity
-            existing.avg_price = pos.avg_price
-            existing.total_cost = pos.total_cost
-            existing.asset_class = pos.asset_class.value
-            existing.currency = pos.currency.value
-            existing.consistency_hash = pos.consistency_hash
-        else:
-            model = _pos_entity_to_model(pos)
-            model.id = None
-            session.add(model)
-        session.flush()
+        PositionRepository.bulk_upsert(session, [pos])
+
+    @staticmethod
+    def bulk_upsert(session: Session, positions: Sequence[Position]) -> None:
+        """Insert or update many positions in one executemany statement
+        (INSERT ... ON CONFLICT(ticker, institution) DO UPDATE)."""
+        if not positions:
+            return
+        rows = []
+        for pos in positions:
+            pos.seal()
+            rows.append({
+                "ticker": pos.ticker,
+                "asset_class": pos.asset_class.value,
+                "quantity": pos.quantity,
+                "avg_price": pos.avg_price,
+                "currency": pos.currency.value,
+                "total_cost": pos.total_cost,
+                "institution": pos.institution,
+                "consistency_hash": pos.consistency_hash,
+            })
+        session.execute(_UPSERT_POSITION, rows)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -289,8 +455,24 @@ class TaxLossRepository:
         session: Session, asset_class: AssetClass, trade_type: TradeType
     ) -> Decimal:
         """Return the latest accumulated loss (or 0)."""
-        row = session.execute(
-            select(TaxLossModel)
+        loss = session.execute(
+            select(TaxLossModel.accumulated_loss)
+            .where(
+                TaxLossModel.asset_class == asset_class.value,
+                TaxLossModel.trade_type == trade_type.value,
+            )
+            .order_by(TaxLossModel.month_ref.desc())
+            .limit(1)
+        ).scalar()
+        return loss if loss is not None else Decimal("0")
+
+    @staticmethod
+    def get_latest_month(
+        session: Session, asset_class: AssetClass, trade_type: TradeType
+    ) -> Optional[str]:
+        """Return the most recent month_ref (YYYY-MM) stored, or None."""
+        return session.execute(
+            select(TaxLossModel.month_ref)
             .where(
                 TaxLossModel.asset_class == asset_class.value,
                 TaxLossModel.trade_type == trade_type.value,
@@ -298,7 +480,6 @@ class TaxLossRepository:
             .order_by(TaxLossModel.month_ref.desc())
             .limit(1)
         ).scalar_one_or_none()
-        return row.accumulated_loss if row else Decimal("0")
 
     @staticmethod
     def upsert(
@@ -308,23 +489,28 @@ class TaxLossRepository:
         accumulated_loss: Decimal,
         month_ref: str,
     ) -> None:
-        existing = session.execute(
-            select(TaxLossModel).where(
-                TaxLossModel.asset_class == asset_class.value,
-                TaxLossModel.trade_type == trade_type.value,
-                TaxLossModel.month_ref == month_ref,
-            )
-        ).scalar_one_or_none()
-        if existing:
-            existing.accumulated_loss = accumulated_loss
-        else:
-            session.add(TaxLossModel(
-                asset_class=asset_class.value,
-                trade_type=trade_type.value,
-                accumulated_loss=accumulated_loss,
-                month_ref=month_ref,
-            ))
-        session.flush()
+        TaxLossRepository.bulk_upsert(
+            session, [TaxLoss(asset_class, trade_type, accumulated_loss, month_ref)]
+        )
+
+    @staticmethod
+    def bulk_upsert(session: Session, losses: Sequence[TaxLoss]) -> None:
+        """Insert or update many monthly tax losses in one executemany
+        statement (INSERT ... ON CONFLICT DO UPDATE)."""
+        if not losses:
+            return
+        session.execute(
+            _UPSERT_TAX_LOSS,
+            [
+                {
+                    "asset_class": loss.asset_class.value,
+                    "trade_type": loss.trade_type.value,
+                    "accumulated_loss": loss.accumulated_loss,
+                    "month_ref": loss.month_ref,
+                }
+                for loss in losses
+            ],
+        )
 
     @staticmethod
     def clear_all(session: Session) -> None:
@@ -351,14 +537,41 @@ class CustodianRepository:
             for r in rows
         ]
 
+    @staticmethod
+    def replace_for_tickers(
+        session: Session,
+        tickers: Sequence[str],
+        custodians: list[PortfolioCustodian],
+    ) -> None:
+        """Replace the custodian rows of *tickers* only, leaving the rest
+        of the table untouched (cf. rebuild)."""
+        session.execute(
+            delete(PortfolioCustodianModel)
+            .where(PortfolioCustodianModel.ticker.in_(tickers))
+        )
+        CustodianRepository._insert(session, custodians)
+
     @staticmethod
     def rebuild(session: Session, custodians: list[PortfolioCustodian]) -> None:
         session.execute(delete(PortfolioCustodianModel))
-        for c in custodians:
-            session.add(PortfolioCustodianModel(
-                ticker=c.ticker, institution=c.institution, quantity=c.quantity,
-            ))
-        session.flush()
+        CustodianRepository._insert(session, custodians)
+
+    @staticmethod
+    def _insert(session: Session, custodians: list[PortfolioCustodian]) -> None:
+        """One executemany INSERT, bypassing the ORM unit of work."""
+        if not custodians:
+            return
+        session.execute(
+            insert(PortfolioCustodianModel),
+            [
+                {
+                    "ticker": c.ticker,
+                    "institution": c.institution,
+                    "quantity": c.quantity,
+                }
+                for c in custodians
+            ],
+        )
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -375,18 +588,48 @@ class AuditLogRepository:
         action: str,
         old_data: str | None = None,
         new_data: str | None = None,
+        timestamp: Optional[datetime] = None,
     ) -> None:
-        session.add(AuditLogModel(
-            table_name=table_name,
-            record_id=record_id,
-            action=action,
-            old_data=old_data,
-            new_data=new_data,
-            timestamp=datetime.utcnow(),
-        ))
+        """Buffer an audit entry on the session; the buffer is written in
+        one bulk INSERT before commit (or before an audit read)."""
+        session.info.setdefault(AUDIT_BUFFER_KEY, []).append({
+            "table_name": table_name,
+            "record_id": record_id,
+            "action": action,
+            "old_data": old_data,
+            "new_data": new_data,
+            "timestamp": timestamp or datetime.utcnow(),
+        })
+
+    @staticmethod
+    def get_max_id(session: Session, table_name: str) -> int:
+        """Return the id of the latest entry for *table_name* (or 0)."""
+        flush_audit_buffer(session)
+        return session.execute(
+            select(func.max(AuditLogModel.id))
+            .where(AuditLogModel.table_name == table_name)
+        ).scalar() or 0
+
+    @staticmethod
+    def get_actions_since(
+        session: Session, table_name: str, after_id: int
+    ) -> list[tuple[str, int]]:
+        """Return (action, record_id) pairs logged for *table_name* after
+        the entry *after_id*, in log order."""
+        flush_audit_buffer(session)
+        rows = session.execute(
+            select(AuditLogModel.action, AuditLogModel.record_id)
+            .where(
+                AuditLogModel.table_name == table_name,
+                AuditLogModel.id > after_id,
+            )
+            .order_by(AuditLogModel.id)
+        ).all()
+        return [(action, record_id) for action, record_id in rows]
 
     @staticmethod
     def get_recent(session: Session, limit: int = 100) -> list[AuditLogEntry]:
+        flush_audit_buffer(session)
         rows = session.execute(
             select(AuditLogModel)
             .order_by(AuditLogModel.timestamp.desc())
@@ -432,9 +675,9 @@ class InstitutionRepository:
     @staticmethod
     def add(session: Session, name: str, cnpj: str = "") -> int:
         existing = session.execute(
-            select(InstitutionModel).where(InstitutionModel.name == name)
-        ).scalar_one_or_none()
-        if existing:
+            select(literal(1)).where(InstitutionModel.name == name).limit(1)
+        ).first()
+        if existing is not None:
             raise ValueError(f"Instituição '{name}' já existe.")
         m = InstitutionModel(name=name, cnpj=cnpj, active=1)
         session.add(m)
@@ -451,18 +694,19 @@ class InstitutionRepository:
     @staticmethod
     def seed_defaults(session: Session) -> None:
         """Seed default institutions if the table is empty."""
-        count = session.execute(
-            select(InstitutionModel)
-        ).scalars().first()
-        if count is not None:
+        seeded = session.execute(
+            select(literal(1)).select_from(InstitutionModel).limit(1)
+        ).first()
+        if seeded is not None:
             return  # already seeded
         defaults = [
             "XP Investimentos", "BTG Pactual", "Rico", "Clear",
             "Nu Invest", "Inter", "Itaú", "Bradesco", "Modal",
         ]
-        for name in defaults:
-            session.add(InstitutionModel(name=name, cnpj="", active=1))
-        session.flush()
+        session.execute(
+            insert(InstitutionModel),
+            [{"name": name, "cnpj": "", "active": 1} for name in defaults],
+        )
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -473,7 +717,6 @@ class SettingsRepository:
 
     @staticmethod
     def get(session: Session, key: str, default: str = "") -> str:
-        from infrastructure.database import AppSettingsModel
         row = session.execute(
             select(AppSettingsModel).where(AppSettingsModel.key == key)
         ).scalar_one_or_none()
@@ -481,15 +724,7 @@ class SettingsRepository:
 
     @staticmethod
     def set(session: Session, key: str, value: str) -> None:
-        from infrastructure.database import AppSettingsModel
-        row = session.execute(
-            select(AppSettingsModel).where(AppSettingsModel.key == key)
-        ).scalar_one_or_none()
-        if row:
-            row.value = value
-        else:
-            session.add(AppSettingsModel(key=key, value=value))
-        session.flush()
+        session.execute(_UPSERT_SETTING, {"key": key, "value": value})
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -504,9 +739,38 @@ def _decimal_default(obj):
     raise TypeError(f"Not serializable: {type(obj)}")
 
 
+# Audit payloads, per model: the column names sorted (so the encoder emits
+# sorted keys without re-sorting each dict) and the (name, converter)
+# pairs of Decimal/date columns, stringified up front instead of through
+# the encoder's default= callback (kept as a fallback)
+_AUDIT_SERIALIZERS: dict[type, tuple[tuple[str, ...], tuple]] = {}
+_AUDIT_CONVERTERS = {
+    Decimal: str, date: date.isoformat, datetime: datetime.isoformat,
+}
+_AUDIT_ENCODER = json.JSONEncoder(default=_decimal_default)
+
+
+def _audit_serializers(model_cls) -> tuple[tuple[str, ...], tuple]:
+    columns = sorted(model_cls.__table__.columns, key=lambda c: c.name)
+    converted = []
+    for c in columns:
+        try:
+            conv = _AUDIT_CONVERTERS.get(c.type.python_type)
+        except NotImplementedError:
+            conv = None
+        if conv is not None and not c.nullable:
+            converted.append((c.name, conv))
+    return tuple(c.name for c in columns), tuple(converted)
+
+
 def _model_to_json(model) -> str:
-    data = {
-        c.name: getattr(model, c.name)
-        for c in model.__table__.columns
-    }
-    return json.dumps(data, default=_decimal_default, sort_keys=True)
+    serializers = _AUDIT_SERIALIZERS.get(type(model))
+    if serializers is None:
+        serializers = _AUDIT_SERIALIZERS[type(model)] = (
+            _audit_serializers(type(model))
+        )
+    names, converted = serializers
+    data = {name: getattr(model, name) for name in names}
+    for name, conv in converted:
+        data[name] = conv(data[name])
+    return _AUDIT_ENCODER.encode(data)
@@ -5,11 +5,22 @@ from __future__ import annotations
 import logging
 import queue
 import threading
+import time
 from concurrent.futures import Future
 from typing import Any, Callable
 
+from sqlalchemy import text
+
+from infrastructure.database import flush_audit_buffer
+
 log = logging.getLogger(__name__)
 
+# Seconds between the writer's periodic "PRAGMA optimize" runs
+_OPTIMIZE_INTERVAL = 15 * 60
+
+# Most already-queued jobs coalesced into one transaction
+BATCH_MAX = 64
+
 
 class WriteQueueManager:
     """Serialises all database write operations onto a dedicated thread.
@@ -23,11 +34,20 @@ class WriteQueueManager:
         result  = future.result(timeout=10)   # blocks until done
 
         wq.stop()
+
+    Jobs already queued when the worker picks one up (up to
+    ``BATCH_MAX``) share one session and one commit, so a burst of writes
+    pays for a single fsync; a lone write is never held back waiting for
+    company.  Each job runs in its own SAVEPOINT: if it raises, only its
+    changes are rolled back and only its Future gets the exception.  No
+    job is ever run twice.  Futures resolve only after the commit.
     """
 
     def __init__(self, session_factory) -> None:
         self._session_factory = session_factory
-        self._queue: queue.Queue[tuple[Callable, Future] | None] = queue.Queue()
+        self._queue: queue.Queue[tuple[Callable, Future] | None] = (
+            queue.Queue()
+        )
         self._thread: threading.Thread | None = None
         self._running = False
 
@@ -71,19 +91,76 @@ class WriteQueueManager:
     # ── worker loop ────────────────────────────────────────────────────
 
     def _worker(self) -> None:
+        last_optimize = time.monotonic()
         while True:
             item = self._queue.get()
             if item is None:
                 break
-            fn, future = item
-            session = self._session_factory()
+            batch, stop = self._drain(item)
+            self._run_batch(batch)
+
+            now = time.monotonic()
+            if now - last_optimize >= _OPTIMIZE_INTERVAL:
+                last_optimize = now
+                self._optimize()
+            if stop:
+                break
+
+    def _drain(self, first) -> tuple[list[tuple[Callable, Future]], bool]:
+        """Collect *first* plus whatever else is already queued.
+
+        Returns the batch and whether the stop sentinel was reached.
+        """
+        batch = [first]
+        while len(batch) < BATCH_MAX:
             try:
-                result = fn(session)
-                session.commit()
-                future.set_result(result)
-            except Exception as exc:
-                session.rollback()
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run_batch(self, batch: list[tuple[Callable, Future]]) -> None:
+        """Run *batch* in one transaction, each job in its own SAVEPOINT."""
+        session = self._session_factory()
+        outcomes: list[tuple[Future, Any, BaseException | None]] = []
+        try:
+            for fn, future in batch:
+                try:
+                    with session.begin_nested():
+                        result = fn(session)
+                        # Written inside the savepoint, so a later job's
+                        # rollback cannot discard this job's audit rows
+                        flush_audit_buffer(session)
+                except Exception as exc:
+                    log.exception("WriteQueueManager error")
+                    outcomes.append((future, None, exc))
+                else:
+                    outcomes.append((future, result, None))
+            session.commit()
+        except Exception as exc:
+            session.rollback()
+            log.exception("WriteQueueManager commit failed")
+            outcomes = [(future, None, exc) for future, _, _ in outcomes]
+        finally:
+            session.close()
+        for future, result, exc in outcomes:
+            if exc is not None:
                 future.set_exception(exc)
-                log.exception("WriteQueueManager error")
-            finally:
-                session.close()
+            else:
+                future.set_result(result)
+
+    def _optimize(self) -> None:
+        """Refresh SQLite's planner statistics where they look stale."""
+        session = self._session_factory()
+        try:
+            session.execute(text("PRAGMA optimize"))
+            # Runs inside the writer engine's explicit BEGIN: the ANALYZE
+            # results are only kept once committed
+            session.commit()
+        except Exception:
+            log.exception("PRAGMA optimize failed")
+        finally:
+            session.close()
@@ -22,12 +22,17 @@ def main():
     log = logging.getLogger("portfolio")
 
     # ── Database setup ─────────────────────────────────────────────────
-    from infrastructure.database import create_db_engine, create_tables, make_session_factory
+    from infrastructure.database import (
+        create_db_engine, create_read_engine, create_tables,
+        make_read_session_factory, make_session_factory,
+    )
     from infrastructure.write_queue import WriteQueueManager
 
     engine = create_db_engine()
     create_tables(engine)
     session_factory = make_session_factory(engine)
+    # UI reads go through their own read-only connections
+    read_session_factory = make_read_session_factory(create_read_engine())
 
     log.info("Database ready")
 
@@ -50,7 +55,7 @@ def main():
     # ── Main Window ────────────────────────────────────────────────────
     from ui.main_window import MainWindow
 
-    window = MainWindow(session_factory, wq)
+    window = MainWindow(session_factory, wq, read_session_factory)
     window.show()
 
     log.info("Application started")
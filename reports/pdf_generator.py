@@ -2,27 +2,88 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
-
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.lib.units import mm
-from reportlab.platypus import (
-    Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle,
+from itertools import chain
+from operator import attrgetter
+from typing import TYPE_CHECKING, Iterable, Iterator, NamedTuple, Optional
+
+from domain.entities import PortfolioCustodian, Position
+from reports.report_export import (
+    emit_chunked_table, paragraph_style, sample_styles,
 )
 
-from babel.numbers import format_currency
+if TYPE_CHECKING:
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.platypus import TableStyle
+
+
+class _ReportStyles(NamedTuple):
+    heading: ParagraphStyle
+    title: ParagraphStyle
+    meta: ParagraphStyle
+    footer: ParagraphStyle
+    positions: TableStyle
+    custody: TableStyle
+
+
+# ReportLab and the babel locale data are only loaded on the first
+# report; see reports.report_export._styles.
+@functools.cache
+def _styles() -> _ReportStyles:
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+
+    table_commands = [
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#E0E0E0")),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 9),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#DDDDDD")),
+        ("ROWBACKGROUNDS", (0, 1), (-1, -1),
+         [colors.white, colors.HexColor("#F9F9F9")]),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        ("TOPPADDING", (0, 0), (-1, -1), 3),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
+    ]
+    return _ReportStyles(
+        heading=sample_styles()["Heading2"],
+        title=paragraph_style(
+            "CustomTitle", "Title", 18, color="#0078D4", space_after=6,
+        ),
+        meta=paragraph_style("Meta", "Normal", 10, space_after=4),
+        footer=paragraph_style(
+            "Footer", "Normal", 8, color="#999999",
+            alignment=1,  # center
+        ),
+        positions=TableStyle(
+            table_commands + [("ALIGN", (2, 1), (4, -1), "RIGHT")]
+        ),
+        custody=TableStyle(
+            table_commands + [("ALIGN", (2, 1), (2, -1), "RIGHT")]
+        ),
+    )
 
-from domain.entities import PortfolioCustodian, Position
+
+_ZERO = Decimal("0")
 
 
+# Resolve the pt_BR currency pattern once; format_currency() would look
+# the locale and pattern up again for every cell.
+@functools.cache
+def _brl_pattern():
+    from babel import Locale
+
+    locale = Locale.parse("pt_BR")
+    return locale, locale.currency_formats["standard"]
+
+
+@functools.lru_cache(maxsize=4096)
 def _fmt_brl(value) -> str:
     try:
-        return format_currency(float(value), "BRL", locale="pt_BR")
+        locale, pattern = _brl_pattern()
+        return pattern.apply(float(value), locale, currency="BRL")
     except Exception:
         return f"R$ {float(value):,.2f}"
 
@@ -40,11 +101,25 @@ class PdfReportGenerator:
     def generate(
         self,
         output_path: str,
-        positions: list[Position],
-        custodians: list[PortfolioCustodian] | None = None,
+        positions: Iterable[Position],
+        custodians: Iterable[PortfolioCustodian] | None = None,
+        *,
+        pre_sorted: bool = True,
     ) -> str:
-        """Generate a PDF and return the output path."""
+        """Generate a PDF and return the output path.
+
+        *positions* may be any iterable (e.g. a generator): rows are
+        formatted and laid out chunk by chunk as they are consumed.
+        *custodians* are expected in (institution, ticker) order, as
+        CustodianRepository.get_all returns them; pass pre_sorted=False
+        to have them sorted here.
+        """
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.units import mm
+        from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+
         os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        styles = _styles()
 
         doc = SimpleDocTemplate(
             output_path, pagesize=A4,
@@ -52,102 +127,77 @@ class PdfReportGenerator:
             topMargin=20 * mm, bottomMargin=20 * mm,
         )
 
-        styles = getSampleStyleSheet()
         story = []
 
         # Title
-        title_style = ParagraphStyle(
-            "CustomTitle", parent=styles["Title"],
-            fontSize=18, textColor=colors.HexColor("#0078D4"),
-            spaceAfter=6,
-        )
-        story.append(Paragraph("💰 Relatório de Portfólio", title_style))
+        story.append(Paragraph("💰 Relatório de Portfólio", styles.title))
         story.append(Spacer(1, 4 * mm))
 
         # Metadata
         now = datetime.now().strftime("%d/%m/%Y %H:%M")
-        open_positions = [p for p in positions if p.quantity > Decimal("0")]
-        total_cost = sum(float(p.total_cost) for p in open_positions)
-
-        meta_style = ParagraphStyle(
-            "Meta", parent=styles["Normal"], fontSize=10, spaceAfter=4,
-        )
-        story.append(Paragraph(f"Gerado em: {now}", meta_style))
-        story.append(Paragraph(
-            f"Patrimônio Total (Custo): <b>{_fmt_brl(total_cost)}</b> | "
-            f"Posições Abertas: <b>{len(open_positions)}</b>",
-            meta_style,
-        ))
+        story.append(Paragraph(f"Gerado em: {now}", styles.meta))
+        # The totals line is filled in once the positions have streamed
+        totals_at = len(story)
+        story.append(None)
         story.append(Spacer(1, 6 * mm))
 
         # ── Positions Table ────────────────────────────────────────────
-        story.append(Paragraph("Posições", styles["Heading2"]))
+        story.append(Paragraph("Posições", styles.heading))
         story.append(Spacer(1, 2 * mm))
 
-        pos_data = [["Ticker", "Classe", "Qtd", "PM", "Custo Total", "Instituição"]]
-        for p in open_positions:
-            pos_data.append([
-                p.ticker,
-                p.asset_class.label,
-                _fmt_qty(p.quantity),
-                _fmt_brl(p.avg_price),
-                _fmt_brl(p.total_cost),
-                p.institution,
-            ])
-
-        if len(pos_data) > 1:
-            t = Table(pos_data, repeatRows=1)
-            t.setStyle(TableStyle([
-                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#E0E0E0")),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, -1), 9),
-                ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#DDDDDD")),
-                ("ROWBACKGROUNDS", (0, 1), (-1, -1),
-                 [colors.white, colors.HexColor("#F9F9F9")]),
-                ("ALIGN", (2, 1), (4, -1), "RIGHT"),
-                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                ("TOPPADDING", (0, 0), (-1, -1), 3),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
-            ]))
-            story.append(t)
-        else:
-            story.append(Paragraph("Nenhuma posição aberta.", meta_style))
+        open_count = 0
+        total_cost = _ZERO
+
+        def open_rows() -> Iterator[list[str]]:
+            nonlocal open_count, total_cost
+            for p in positions:
+                if p.quantity <= _ZERO:
+                    continue
+                open_count += 1
+                total_cost += p.total_cost
+                yield [
+                    p.ticker,
+                    p.asset_class.label,
+                    _fmt_qty(p.quantity),
+                    _fmt_brl(p.avg_price),
+                    _fmt_brl(p.total_cost),
+                    p.institution,
+                ]
+
+        pos_header = ["Ticker", "Classe", "Qtd", "PM", "Custo Total", "Instituição"]
+        if not emit_chunked_table(story, pos_header, open_rows(), styles.positions):
+            story.append(Paragraph("Nenhuma posição aberta.", styles.meta))
+
+        story[totals_at] = Paragraph(
+            f"Patrimônio Total (Custo): <b>{_fmt_brl(total_cost)}</b> | "
+            f"Posições Abertas: <b>{open_count}</b>",
+            styles.meta,
+        )
 
         story.append(Spacer(1, 8 * mm))
 
         # ── Custody Table ──────────────────────────────────────────────
-        if custodians:
-            story.append(Paragraph("Custódia por Instituição", styles["Heading2"]))
+        custodians = iter(custodians or ())
+        if not pre_sorted:
+            custodians = iter(sorted(
+                custodians, key=attrgetter("institution", "ticker")
+            ))
+        first = next(custodians, None)
+        if first is not None:
+            story.append(Paragraph("Custódia por Instituição", styles.heading))
             story.append(Spacer(1, 2 * mm))
 
-            cust_data = [["Instituição", "Ticker", "Quantidade"]]
-            for c in sorted(custodians, key=lambda x: (x.institution, x.ticker)):
-                cust_data.append([c.institution, c.ticker, _fmt_qty(c.quantity)])
-
-            t2 = Table(cust_data, repeatRows=1)
-            t2.setStyle(TableStyle([
-                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#E0E0E0")),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, -1), 9),
-                ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#DDDDDD")),
-                ("ROWBACKGROUNDS", (0, 1), (-1, -1),
-                 [colors.white, colors.HexColor("#F9F9F9")]),
-                ("ALIGN", (2, 1), (2, -1), "RIGHT"),
-                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                ("TOPPADDING", (0, 0), (-1, -1), 3),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
-            ]))
-            story.append(t2)
+            cust_header = ["Instituição", "Ticker", "Quantidade"]
+            cust_rows = (
+                [c.institution, c.ticker, _fmt_qty(c.quantity)]
+                for c in chain((first,), custodians)
+            )
+            emit_chunked_table(story, cust_header, cust_rows, styles.custody)
 
         # Footer
         story.append(Spacer(1, 10 * mm))
-        footer_style = ParagraphStyle(
-            "Footer", parent=styles["Normal"],
-            fontSize=8, textColor=colors.HexColor("#999999"),
-            alignment=1,  # center
-        )
         story.append(Paragraph(
-            "Portfolio Control System 0.0.1 — Gerado automaticamente", footer_style
+            "Portfolio Control System 0.0.1 — Gerado automaticamente", styles.footer
         ))
 
         doc.build(story)
@@ -8,43 +8,176 @@ given output path.
 from __future__ import annotations
 
 import csv
+import functools
 import os
 from datetime import datetime
 from decimal import Decimal
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, NamedTuple, Sequence
 
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4, landscape
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.lib.units import mm
-from reportlab.platypus import (
-    Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle,
-)
+if TYPE_CHECKING:
+    from reportlab.lib.styles import ParagraphStyle, StyleSheet1
+    from reportlab.platypus import TableStyle
+
+
+@functools.cache
+def sample_styles() -> StyleSheet1:
+    """ReportLab's sample stylesheet, built once for all reports."""
+    from reportlab.lib.styles import getSampleStyleSheet
+
+    return getSampleStyleSheet()
+
+
+@functools.lru_cache(maxsize=32)
+def paragraph_style(
+    name: str,
+    parent: str,
+    font_size: float,
+    *,
+    color: str | None = None,
+    space_after: float = 0,
+    alignment: int = 0,
+) -> ParagraphStyle:
+    """Shared ParagraphStyle derived from sample_styles()[*parent*].
+
+    Styles are only read during layout, so equal parameters get the same
+    instance across every report module.
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.styles import ParagraphStyle
+
+    extra = {"textColor": colors.HexColor(color)} if color else {}
+    return ParagraphStyle(
+        name, parent=sample_styles()[parent], fontSize=font_size,
+        spaceAfter=space_after, alignment=alignment, **extra,
+    )
+
+
+class _ExportStyles(NamedTuple):
+    title: ParagraphStyle
+    meta: ParagraphStyle
+    footer: ParagraphStyle
+    table: TableStyle
+
+
+# ReportLab takes ~100 ms to import, and this module is imported by the
+# UI at startup just to wire up export actions: the import and the
+# style construction are deferred to the first PDF export and cached.
+@functools.cache
+def _styles() -> _ExportStyles:
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+
+    return _ExportStyles(
+        title=paragraph_style(
+            "RptTitle", "Title", 16, color="#0078D4", space_after=4,
+        ),
+        meta=paragraph_style("Meta", "Normal", 9, space_after=4),
+        footer=paragraph_style(
+            "Footer", "Normal", 7, color="#999999", alignment=1,
+        ),
+        table=TableStyle([
+            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#E0E0E0")),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, -1), 8),
+            ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#DDDDDD")),
+            ("ROWBACKGROUNDS", (0, 1), (-1, -1),
+             [colors.white, colors.HexColor("#F9F9F9")]),
+            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+            ("TOPPADDING", (0, 0), (-1, -1), 3),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
+        ]),
+    )
+
+
+_CSV_BUFFER = 1 << 20
 
 
 def export_csv(
     path: str,
-    headers: list[str],
-    rows: list[list[str]],
+    headers: Sequence[str],
+    rows: Iterable[Sequence[str]],
 ) -> str:
-    """Write headers + rows to a CSV file. Returns the path."""
+    """Write headers + rows to a CSV file. Returns the path.
+
+    *rows* may be any iterable; it is consumed lazily and never held
+    in memory as a whole.
+    """
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+    with open(
+        path, "w", newline="", encoding="utf-8-sig", buffering=_CSV_BUFFER,
+    ) as f:
         writer = csv.writer(f, delimiter=";")
         writer.writerow(headers)
-        writer.writerows(rows)
+        write = f.write
+        for row in rows:
+            # Rows of plain strings that need no quoting are joined
+            # directly; anything else goes through csv.writer, so the
+            # output is identical either way
+            try:
+                line = ";".join(row)
+            except TypeError:
+                writer.writerow(row)
+                continue
+            if (
+                line.count(";") == len(row) - 1 and line
+                and '"' not in line and "\n" not in line and "\r" not in line
+            ):
+                write(line + "\r\n")
+            else:
+                writer.writerow(row)
     return path
 
 
+# Rows per Platypus Table: layout cost grows faster than linearly with
+# the rows of a single table, so long listings are emitted as a run of
+# tables of this size, each repeating the header
+_ROWS_PER_TABLE = 500
+
+
+def emit_chunked_table(
+    story: list,
+    headers: Sequence[str],
+    rows: Iterable[Sequence[str]],
+    style: TableStyle,
+    chunk: int = _ROWS_PER_TABLE,
+) -> bool:
+    """Append *rows* to *story* as consecutive Tables of at most *chunk*
+    rows under a repeated header, sharing one prebuilt *style*.
+
+    *rows* is consumed lazily.  Returns False if it was empty.
+    """
+    from reportlab.platypus import Table
+
+    it = iter(rows)
+    emitted = False
+    while block := list(islice(it, chunk)):
+        table = Table([headers, *block], repeatRows=1)
+        table.setStyle(style)
+        story.append(table)
+        emitted = True
+    return emitted
+
+
 def export_pdf(
     path: str,
     title: str,
     headers: list[str],
-    rows: list[list[str]],
+    rows: Iterable[Sequence[str]],
     *,
     landscape_mode: bool = False,
 ) -> str:
-    """Generate a PDF table report. Returns the path."""
+    """Generate a PDF table report. Returns the path.
+
+    *rows* may be any iterable; it is consumed lazily, a table of
+    _ROWS_PER_TABLE rows (plus the header) at a time.
+    """
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.lib.units import mm
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    styles = _styles()
 
     page = landscape(A4) if landscape_mode else A4
     doc = SimpleDocTemplate(
@@ -53,50 +186,24 @@ def export_pdf(
         topMargin=15 * mm, bottomMargin=15 * mm,
     )
 
-    styles = getSampleStyleSheet()
     story: list = []
 
     # Title
-    title_style = ParagraphStyle(
-        "RptTitle", parent=styles["Title"],
-        fontSize=16, textColor=colors.HexColor("#0078D4"),
-        spaceAfter=4,
-    )
-    story.append(Paragraph(title, title_style))
+    story.append(Paragraph(title, styles.title))
 
     # Date
     now = datetime.now().strftime("%d/%m/%Y %H:%M")
-    meta = ParagraphStyle("Meta", parent=styles["Normal"], fontSize=9, spaceAfter=4)
-    story.append(Paragraph(f"Gerado em: {now}", meta))
+    story.append(Paragraph(f"Gerado em: {now}", styles.meta))
     story.append(Spacer(1, 4 * mm))
 
     # Table
-    table_data = [headers] + rows
-    if len(table_data) > 1:
-        t = Table(table_data, repeatRows=1)
-        t.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#E0E0E0")),
-            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-            ("FONTSIZE", (0, 0), (-1, -1), 8),
-            ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#DDDDDD")),
-            ("ROWBACKGROUNDS", (0, 1), (-1, -1),
-             [colors.white, colors.HexColor("#F9F9F9")]),
-            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-            ("TOPPADDING", (0, 0), (-1, -1), 3),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
-        ]))
-        story.append(t)
-    else:
-        story.append(Paragraph("Nenhum dado disponível.", meta))
+    if not emit_chunked_table(story, headers, rows, styles.table):
+        story.append(Paragraph("Nenhum dado disponível.", styles.meta))
 
     # Footer
     story.append(Spacer(1, 8 * mm))
-    footer = ParagraphStyle(
-        "Footer", parent=styles["Normal"],
-        fontSize=7, textColor=colors.HexColor("#999999"), alignment=1,
-    )
     story.append(Paragraph(
-        "Portfolio Control System — Gerado automaticamente", footer,
+        "Portfolio Control System — Gerado automaticamente", styles.footer,
     ))
 
     doc.build(story)
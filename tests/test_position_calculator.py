@@ -116,6 +116,31 @@ class TestPositionCalculator:
         assert p.avg_price == Decimal("100.00")
         assert p.total_cost == Decimal("1000.00")
 
+    def test_inplit_divides_exact_total_cost(self):
+        # avg 10.005 rounds to 10.01; the inplit must divide the exact
+        # 6003.00, not 600 × 10.01 = 6006.00
+        calc = PositionCalculator()
+        calc.process(_make_tx(qty=300, price="10.00"))
+        calc.process(_make_tx(qty=300, price="10.01"))
+        calc.process(_make_tx(tx_type=TransactionType.INPLIT, qty=100, price="0"))
+        p = calc.get_positions()[0]
+        assert p.quantity == Decimal("6")
+        assert p.avg_price == Decimal("1000.50")
+        assert p.total_cost == Decimal("6003.00")
+
+    def test_inplit_across_institutions(self):
+        calc = PositionCalculator()
+        calc.process(_make_tx(qty=100, price="10.00"))
+        calc.process(_make_tx(qty=100, price="10.01", institution="BTG"))
+        for inst in ("XP", "BTG"):
+            calc.process(_make_tx(
+                tx_type=TransactionType.INPLIT, qty=10, price="0", institution=inst
+            ))
+        by_inst = {p.institution: p for p in calc.get_positions()}
+        assert by_inst["XP"].quantity == Decimal("10")
+        assert by_inst["BTG"].quantity == Decimal("10")
+        assert by_inst["XP"].avg_price == Decimal("100.05")
+
     def test_multiple_institutions(self):
         calc = PositionCalculator()
         calc.process(_make_tx(qty=100, price="30.00", institution="XP"))
@@ -125,3 +150,41 @@ class TestPositionCalculator:
         tickers_inst = {p.market_key for p in positions}
         assert "PETR4@XP" in tickers_inst
         assert "PETR4@BTG" in tickers_inst
+
+    def test_fractional_quantity_rounds_half_up(self):
+        calc = PositionCalculator()
+        # cost = 0.5 * 10.01 = 5.005 → 5.01 (ROUND_HALF_UP)
+        calc.process(_make_tx(qty="0.5", price="10.01"))
+        p = calc.get_positions()[0]
+        assert p.quantity == Decimal("0.5")
+        assert p.total_cost == Decimal("5.01")
+        assert p.avg_price == Decimal("10.02")
+
+    def test_replay_matches_process(self):
+        txs = [
+            _make_tx(qty=100, price="30.00"),
+            _make_tx(qty=50, price="36.00", institution="BTG"),
+            _make_tx(tx_type=TransactionType.SELL, qty=40, price="35.00"),
+        ]
+        calc = PositionCalculator()
+        sales = calc.replay(txs)
+        assert len(sales) == 1
+        assert sales[0].avg_cost == Decimal("32.00")
+        assert sales[0].gain_loss == Decimal("120.00")
+
+        step = PositionCalculator()
+        for tx in txs:
+            step.process(tx)
+        assert (
+            [(p.market_key, p.quantity, p.total_cost) for p in calc.get_positions()]
+            == [(p.market_key, p.quantity, p.total_cost) for p in step.get_positions()]
+        )
+
+    def test_get_quantity_per_institution(self):
+        calc = PositionCalculator()
+        calc.process(_make_tx(qty=100, price="30.00", institution="XP"))
+        calc.process(_make_tx(qty=50, price="32.00", institution="BTG"))
+        calc.process(_make_tx(tx_type=TransactionType.SELL, qty=30, price="35.00"))
+        assert calc.get_quantity("PETR4", "XP") == Decimal("70")
+        assert calc.get_quantity("PETR4", "BTG") == Decimal("50")
+        assert calc.get_quantity("PETR4", "Rico") == Decimal("0")
@@ -10,7 +10,10 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 from domain.entities import Transaction
 from domain.enums import AssetClass, Currency, TradeType, TransactionType
 from infrastructure.database import Base, create_db_engine, make_session_factory, create_tables
-from infrastructure.repositories import TransactionRepository, PositionRepository
+from infrastructure.repositories import (
+    CustodianRepository, PositionRepository, TaxLossRepository,
+    TransactionRepository,
+)
 from application.use_cases import RebuildAllUseCase
 
 
@@ -25,7 +28,8 @@ def session():
     sess.close()
 
 
-def _insert_tx(session, ticker, tx_type, qty, price, tx_date, institution="XP"):
+def _insert_tx(session, ticker, tx_type, qty, price, tx_date, institution="XP",
+               commit=True):
     tx = Transaction(
         ticker=ticker,
         asset_class=AssetClass.ACAO,
@@ -39,7 +43,8 @@ def _insert_tx(session, ticker, tx_type, qty, price, tx_date, institution="XP"):
         institution=institution,
     )
     TransactionRepository.insert(session, tx)
-    session.commit()
+    if commit:
+        session.commit()
 
 
 class TestRebuildAll:
@@ -89,3 +94,104 @@ class TestRebuildAll:
             assert p1.quantity == p2.quantity
             assert p1.avg_price == p2.avg_price
             assert p1.consistency_hash == p2.consistency_hash
+
+    def test_incremental_rebuild_matches_full(self, session):
+        _insert_tx(session, "PETR4", TransactionType.BUY, 100, "30.00", date(2025, 1, 10))
+        _insert_tx(session, "VALE3", TransactionType.BUY, 200, "65.00", date(2025, 1, 15))
+        _insert_tx(session, "PETR4", TransactionType.SELL, 50, "25.00", date(2025, 1, 20))
+
+        uc = RebuildAllUseCase()
+        uc.execute(session)
+        session.commit()
+
+        # Appended after the last rebuilt transaction, in a later month
+        _insert_tx(session, "PETR4", TransactionType.BUY, 50, "36.00", date(2025, 2, 10), "BTG")
+        _insert_tx(session, "PETR4", TransactionType.SELL, 30, "40.00", date(2025, 2, 20))
+
+        result = uc.execute_incremental(session)
+        session.commit()
+        assert result["transactions"] == 2
+        incremental = [
+            (p.ticker, p.institution, p.quantity, p.avg_price, p.total_cost)
+            for p in PositionRepository.get_all(session)
+        ]
+        loss = TaxLossRepository.get_latest(
+            session, AssetClass.ACAO, TradeType.SWING_TRADE
+        )
+        custody = sorted(
+            (c.ticker, c.institution, c.quantity)
+            for c in CustodianRepository.get_all(session)
+        )
+
+        uc.execute(session)
+        session.commit()
+        full = [
+            (p.ticker, p.institution, p.quantity, p.avg_price, p.total_cost)
+            for p in PositionRepository.get_all(session)
+        ]
+        assert sorted(incremental) == sorted(full)
+        assert custody == sorted(
+            (c.ticker, c.institution, c.quantity)
+            for c in CustodianRepository.get_all(session)
+        )
+        assert loss == TaxLossRepository.get_latest(
+            session, AssetClass.ACAO, TradeType.SWING_TRADE
+        )
+
+    def test_execute_repairs_derived_tables(self, session):
+        _insert_tx(session, "PETR4", TransactionType.BUY, 100, "30.00", date(2025, 1, 10))
+
+        uc = RebuildAllUseCase()
+        uc.execute(session)
+        session.commit()
+
+        # Derived state drifts without any transaction change
+        PositionRepository.clear_all(session)
+        session.commit()
+
+        result = uc.execute(session)
+        session.commit()
+        assert result["transactions"] == 1
+        assert PositionRepository.get_all(session)[0].quantity == Decimal("100")
+
+    def test_get_positions_bulk(self, session):
+        _insert_tx(session, "PETR4", TransactionType.BUY, 100, "30.00", date(2025, 1, 10))
+        _insert_tx(session, "PETR4", TransactionType.BUY, 50, "36.00", date(2025, 1, 11), "BTG")
+        _insert_tx(session, "VALE3", TransactionType.BUY, 200, "65.00", date(2025, 1, 15))
+        RebuildAllUseCase().execute(session)
+        session.commit()
+
+        found = PositionRepository.get_positions_bulk(
+            session, [("PETR4", "BTG"), ("VALE3", "XP"), ("VALE3", "BTG")]
+        )
+        assert set(found) == {("PETR4", "BTG"), ("VALE3", "XP")}
+        assert found[("PETR4", "BTG")].quantity == Decimal("50")
+        assert PositionRepository.get_positions_bulk(session, []) == {}
+
+    def test_distinct_tickers_ignore_rolled_back_writes(self, session):
+        _insert_tx(session, "PETR4", TransactionType.BUY, 100, "30.00", date(2025, 1, 10))
+        assert TransactionRepository.get_distinct_tickers(session) == ["PETR4"]
+
+        _insert_tx(
+            session, "VALE3", TransactionType.BUY, 200, "65.00", date(2025, 1, 15),
+            commit=False,
+        )
+        assert TransactionRepository.get_distinct_tickers(session) == ["PETR4", "VALE3"]
+        session.rollback()
+        assert TransactionRepository.get_distinct_tickers(session) == ["PETR4"]
+
+    def test_backdated_insert_triggers_full_rebuild(self, session):
+        _insert_tx(session, "PETR4", TransactionType.BUY, 100, "30.00", date(2025, 2, 10))
+
+        uc = RebuildAllUseCase()
+        uc.execute(session)
+        session.commit()
+
+        _insert_tx(session, "PETR4", TransactionType.BUY, 100, "20.00", date(2025, 1, 10))
+        result = uc.execute_incremental(session)
+        session.commit()
+
+        assert result["transactions"] == 2
+        petr = PositionRepository.get_all(session)[0]
+        assert petr.quantity == Decimal("200")
+        assert petr.avg_price == Decimal("25.00")
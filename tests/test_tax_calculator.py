@@ -119,3 +119,13 @@ class TestTaxCalculatorBR:
         # FII has no exemption even below 20k
         assert r.taxable_gain == Decimal("500.00")
         assert r.tax_due == Decimal("75.00")
+
+    def test_carried_loss_stays_quantized(self):
+        """Sums of 2-decimal values need no re-rounding."""
+        calc = TaxCalculatorBR()
+        acc = {(AssetClass.ACAO, TradeType.SWING_TRADE): Decimal("0.10")}
+        sales = [_make_sale("-0.05", "25000.00"), _make_sale("-0.06", "100.00")]
+        calc.calculate_monthly_tax(sales, acc, "2025-03")
+        loss = acc[(AssetClass.ACAO, TradeType.SWING_TRADE)]
+        assert loss == Decimal("0.21")
+        assert loss.as_tuple().exponent == -2
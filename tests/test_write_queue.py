@@ -0,0 +1,126 @@
+"""Tests for the WriteQueueManager."""
+
+import pytest
+import sqlite3
+from datetime import date
+from decimal import Decimal
+
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import text
+
+from domain.entities import Transaction
+from domain.enums import AssetClass, Currency, TradeType, TransactionType
+from infrastructure.database import (
+    create_db_engine, create_tables, make_session_factory,
+)
+from infrastructure.repositories import AuditLogRepository, TransactionRepository
+from infrastructure.write_queue import WriteQueueManager
+
+
+@pytest.fixture
+def factory(tmp_path):
+    """File-backed database: the writer runs on its own thread."""
+    engine = create_db_engine(str(tmp_path / "portfolio.db"))
+    create_tables(engine)
+    yield make_session_factory(engine)
+    engine.dispose()
+
+
+def _tx(ticker):
+    return Transaction(
+        ticker=ticker,
+        asset_class=AssetClass.ACAO,
+        type=TransactionType.BUY,
+        trade_type=TradeType.SWING_TRADE,
+        date=date(2025, 1, 10),
+        quantity=Decimal("100"),
+        price=Decimal("30.00"),
+        currency=Currency.BRL,
+        fx_rate=Decimal("1"),
+        institution="XP",
+    )
+
+
+class TestWriteQueueBatch:
+    def test_failing_job_rolls_back_alone_and_nothing_reruns(self, factory):
+        wq = WriteQueueManager(factory)
+        calls = []
+
+        def insert(ticker):
+            def job(session):
+                calls.append(ticker)
+                return TransactionRepository.insert(session, _tx(ticker))
+            return job
+
+        def failing(session):
+            calls.append("FAIL")
+            TransactionRepository.insert(session, _tx("BAD3"))
+            raise RuntimeError("boom")
+
+        # Queued before the worker starts, so they run as one batch
+        futures = [
+            wq.submit(insert("PETR4")), wq.submit(failing), wq.submit(insert("VALE3")),
+        ]
+        wq.start()
+        try:
+            assert futures[0].result(timeout=5)
+            with pytest.raises(RuntimeError):
+                futures[1].result(timeout=5)
+            assert futures[2].result(timeout=5)
+        finally:
+            wq.stop()
+
+        assert calls == ["PETR4", "FAIL", "VALE3"]
+        session = factory()
+        try:
+            tickers = sorted(t.ticker for t in TransactionRepository.get_all(session))
+            assert tickers == ["PETR4", "VALE3"]
+            actions = AuditLogRepository.get_actions_since(session, "transactions", 0)
+            assert len(actions) == 2
+        finally:
+            session.close()
+
+
+class TestWriterEngine:
+    def test_connect_pragmas_apply_outside_transactions(self, tmp_path):
+        path = tmp_path / "portfolio.db"
+        engine = create_db_engine(str(path))
+        try:
+            create_tables(engine)
+        finally:
+            engine.dispose()
+        # WAL mode cannot be switched inside a transaction, so this checks
+        # the connect hook still runs before the engine's BEGIN
+        conn = sqlite3.connect(path)
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        finally:
+            conn.close()
+
+
+class TestWriteQueueOptimize:
+    def test_optimize_keeps_planner_statistics(self, factory):
+        session = factory()
+        try:
+            TransactionRepository.insert_many(
+                session, [_tx(f"TK{i % 20}") for i in range(200)]
+            )
+            session.commit()
+            # PRAGMA optimize only analyzes tables whose indexes the
+            # connection has used
+            TransactionRepository.get_by_ticker(session, "TK1")
+        finally:
+            session.close()
+
+        WriteQueueManager(factory)._optimize()
+
+        session = factory()
+        try:
+            stat = session.execute(text(
+                "SELECT name FROM sqlite_master WHERE name = 'sqlite_stat1'"
+            )).scalar()
+            assert stat == "sqlite_stat1"
+        finally:
+            session.close()
@@ -4,45 +4,68 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
-from PySide6.QtGui import QColor, QFont
+from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QComboBox, QFileDialog, QHBoxLayout, QHeaderView, QLabel,
     QMessageBox, QPushButton, QTableView, QVBoxLayout, QWidget,
 )
 
-from babel.numbers import format_currency
-
 from domain.entities import Transaction
 from domain.enums import Currency, TransactionType
 from domain.value_objects import round_monetary, round_qty
-from ui.styles import PROFIT_COLOR, LOSS_COLOR
+from ui.styles import PROFIT_COLOR, LOSS_COLOR, bold_font
 from reports.report_export import export_csv, export_pdf
 
 
 ZERO = Decimal("0")
 
+# Role values handed to Qt on every paint, built once
+_PROFIT_QCOLOR = QColor(PROFIT_COLOR)
+_LOSS_QCOLOR = QColor(LOSS_COLOR)
+_ALIGN_RIGHT = Qt.AlignRight | Qt.AlignVCenter
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Helpers
 # ═══════════════════════════════════════════════════════════════════════════
 
+# Currency sign and whether pt_BR separators apply, per currency.  The
+# formatter reproduces babel's format_currency output for pt_BR/BRL and
+# en_US/USD (sign first, NBSP after R$, half-even on the float's repr)
+# without its per-call locale and pattern lookups.
+_CURRENCY_FORMATS = {
+    Currency.BRL: ("R$\xa0", True),
+    Currency.USD: ("$", False),
+}
+_TO_PT_BR = str.maketrans(",.", ".,")
+
+
+def _fmt_currency(value, currency: Currency) -> str:
+    prefix, pt_br = _CURRENCY_FORMATS[currency]
+    d = Decimal(repr(float(value)))
+    if not d.is_finite():
+        raise ValueError(value)
+    body = f"{abs(d):,.2f}"
+    if pt_br:
+        body = body.translate(_TO_PT_BR)
+    return f"-{prefix}{body}" if d.is_signed() else prefix + body
+
+
 def _fmt_brl(value) -> str:
     try:
-        return format_currency(float(value), "BRL", locale="pt_BR")
+        return _fmt_currency(value, Currency.BRL)
     except Exception:
         return f"R$ {float(value):,.2f}"
 
 
 def _fmt_money(value: Decimal, currency: Currency) -> str:
-    locale = "pt_BR" if currency == Currency.BRL else "en_US"
-    curr = "BRL" if currency == Currency.BRL else "USD"
     try:
-        return format_currency(float(value), curr, locale=locale)
+        return _fmt_currency(value, currency)
     except Exception:
-        return f"{curr} {value:,.2f}"
+        return f"{currency.value} {value:,.2f}"
 
 
 def _fmt_qty(value: Decimal) -> str:
@@ -56,12 +79,14 @@ def _fmt_qty(value: Decimal) -> str:
 # Row data: transaction + computed running values
 # ═══════════════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True)
 class _LedgerRow:
     tx: Transaction
     running_qty: Decimal        # saldo de quantidade
     running_avg: Decimal        # preço médio corrente
     realized_gain: Decimal | None  # resultado apurado (só em vendas)
+    # display strings, formatted on first paint and kept with the row
+    cells: tuple[str, ...] | None = None
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -97,9 +122,35 @@ class LedgerTableModel(QAbstractTableModel):
         self._rows: list[_LedgerRow] = []
 
     def set_data(self, transactions: list[Transaction]) -> None:
-        self.beginResetModel()
-        self._rows = self._compute_rows(transactions)
-        self.endResetModel()
+        self.set_rows(self._compute_rows(transactions))
+
+    def set_rows(self, rows: list[_LedgerRow]) -> None:
+        """Show rows already produced by _compute_rows (e.g. cached).
+
+        Rather than a full model reset, which makes the view drop and
+        re-query everything (headers, delegates, viewport), only the
+        row-count difference is announced as an insert/remove and the
+        rows in common as changed data.
+        """
+        old, new = len(self._rows), len(rows)
+        if not old or not new:
+            self.beginResetModel()
+            self._rows = rows
+            self.endResetModel()
+            return
+        if new < old:
+            self.beginRemoveRows(QModelIndex(), new, old - 1)
+            self._rows = rows
+            self.endRemoveRows()
+        elif new > old:
+            self.beginInsertRows(QModelIndex(), old, new - 1)
+            self._rows = rows
+            self.endInsertRows()
+        else:
+            self._rows = rows
+        self.dataChanged.emit(
+            self.index(0, 0), self.index(min(old, new) - 1, len(self.HEADERS) - 1)
+        )
 
     @property
     def final_qty(self) -> Decimal:
@@ -130,15 +181,15 @@ class LedgerTableModel(QAbstractTableModel):
 
             if tx.type == TransactionType.BUY:
                 cost = round_monetary(tx.quantity * tx.price)
-                total_cost = round_monetary(total_cost + cost)
+                total_cost += cost
                 qty = round_qty(qty + tx.quantity)
                 avg_price = round_monetary(total_cost / qty) if qty > ZERO else ZERO
 
             elif tx.type == TransactionType.SELL:
                 cost_of_sold = round_monetary(tx.quantity * avg_price)
                 proceeds = round_monetary(tx.quantity * tx.price)
-                realized = round_monetary(proceeds - cost_of_sold)
-                total_cost = round_monetary(total_cost - cost_of_sold)
+                realized = proceeds - cost_of_sold
+                total_cost -= cost_of_sold
                 qty = round_qty(qty - tx.quantity)
                 if qty <= ZERO:
                     qty = ZERO
@@ -190,7 +241,7 @@ class LedgerTableModel(QAbstractTableModel):
         col = index.column()
 
         if role == Qt.DisplayRole:
-            return self._display(row, col)
+            return self.cells(row)[col]
 
         if role == Qt.ForegroundRole:
             return self._foreground(row, col)
@@ -198,16 +249,25 @@ class LedgerTableModel(QAbstractTableModel):
         if role == Qt.FontRole:
             # Bold the 3 new columns for emphasis
             if col in (self._COL_SALDO, self._COL_PM, self._COL_RESULT):
-                font = QFont()
-                font.setBold(True)
-                return font
+                return bold_font()
             return None
 
         if role == Qt.TextAlignmentRole:
             if col >= self._COL_QTD:
-                return Qt.AlignRight | Qt.AlignVCenter
+                return _ALIGN_RIGHT
         return None
 
+    def cells(self, row: _LedgerRow) -> tuple[str, ...]:
+        """Display strings of *row*, formatted once and then reused by
+        every repaint and export."""
+        cells = row.cells
+        if cells is None:
+            display = self._display
+            cells = row.cells = tuple(
+                display(row, c) for c in range(len(self.HEADERS))
+            )
+        return cells
+
     def _display(self, row: _LedgerRow, col: int) -> str:
         tx = row.tx
         cur = tx.currency
@@ -247,15 +307,15 @@ class LedgerTableModel(QAbstractTableModel):
     def _foreground(row: _LedgerRow, col: int) -> Optional[QColor]:
         if col == LedgerTableModel._COL_TIPO:
             if row.tx.type == TransactionType.BUY:
-                return QColor(PROFIT_COLOR)
+                return _PROFIT_QCOLOR
             if row.tx.type == TransactionType.SELL:
-                return QColor(LOSS_COLOR)
+                return _LOSS_QCOLOR
         if col == LedgerTableModel._COL_RESULT:
             if row.realized_gain is not None:
                 if row.realized_gain > ZERO:
-                    return QColor(PROFIT_COLOR)
+                    return _PROFIT_QCOLOR
                 if row.realized_gain < ZERO:
-                    return QColor(LOSS_COLOR)
+                    return _LOSS_QCOLOR
         return None
 
 
@@ -263,13 +323,22 @@ class LedgerTableModel(QAbstractTableModel):
 # AssetLedgerWidget
 # ═══════════════════════════════════════════════════════════════════════════
 
+# Default widths per LedgerTableModel column; small ledgers are fitted to
+# their contents instead (up to _AUTOSIZE_MAX_ROWS rows)
+_COLUMN_WIDTHS = (90, 80, 70, 55, 90, 100, 120, 100, 110, 120, 60, 70, 130, 60)
+_AUTOSIZE_MAX_ROWS = 500
+
+
 class AssetLedgerWidget(QWidget):
     """Widget showing full transaction history for a specific ticker,
     with running average-price and balance columns."""
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._all_transactions: list[Transaction] = []
+        # ticker -> its transactions, in the order they were given
+        self._by_ticker: dict[str, list[Transaction]] = {}
+        # ticker -> computed ledger rows; valid until set_transactions
+        self._row_cache: dict[str, list[_LedgerRow]] = {}
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -277,19 +346,19 @@ class AssetLedgerWidget(QWidget):
         layout.setSpacing(8)
 
         title = QLabel("Razão Auxiliar de Ativos")
-        title.setStyleSheet("font-size: 18px; font-weight: bold; padding: 4px;")
+        title.setObjectName("pageTitle")
 
         header = QHBoxLayout()
         header.addWidget(title)
         header.addStretch()
 
         btn_pdf = QPushButton("📄 PDF")
-        btn_pdf.setStyleSheet("QPushButton { padding: 6px 12px; font-size: 13px; }")
+        btn_pdf.setObjectName("exportBtn")
         btn_pdf.clicked.connect(self._export_pdf)
         header.addWidget(btn_pdf)
 
         btn_csv = QPushButton("📊 CSV")
-        btn_csv.setStyleSheet("QPushButton { padding: 6px 12px; font-size: 13px; }")
+        btn_csv.setObjectName("exportBtn")
         btn_csv.clicked.connect(self._export_csv)
         header.addWidget(btn_csv)
 
@@ -306,11 +375,11 @@ class AssetLedgerWidget(QWidget):
 
         # Summary labels
         self.lbl_qty = QLabel("Qtd: —")
-        self.lbl_qty.setStyleSheet("font-weight: bold;")
+        self.lbl_qty.setObjectName("summaryLabel")
         self.lbl_avg = QLabel("PM: —")
-        self.lbl_avg.setStyleSheet("font-weight: bold;")
+        self.lbl_avg.setObjectName("summaryLabel")
         self.lbl_cost = QLabel("Custo: —")
-        self.lbl_cost.setStyleSheet("font-weight: bold;")
+        self.lbl_cost.setObjectName("summaryLabel")
         filter_layout.addWidget(self.lbl_qty)
         filter_layout.addWidget(self.lbl_avg)
         filter_layout.addWidget(self.lbl_cost)
@@ -322,10 +391,14 @@ class AssetLedgerWidget(QWidget):
         self.table.setAlternatingRowColors(True)
         self.table.setSelectionBehavior(QTableView.SelectRows)
         self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        # Interactive, not ResizeToContents: the latter re-measures every
+        # row of every column on each model reset
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
         self.table.verticalHeader().setDefaultSectionSize(26)
         self._model = LedgerTableModel()
         self.table.setModel(self._model)
+        for col, width in enumerate(_COLUMN_WIDTHS):
+            self.table.setColumnWidth(col, width)
         self.table.clicked.connect(self._on_table_click)
         layout.addWidget(self.table)
 
@@ -346,8 +419,15 @@ class AssetLedgerWidget(QWidget):
 
     def set_transactions(self, transactions: list[Transaction]) -> None:
         """Set the full transaction list and populate the ticker combo."""
-        self._all_transactions = transactions
-        tickers = sorted(set(t.ticker for t in transactions))
+        by_ticker: dict[str, list[Transaction]] = {}
+        for t in transactions:
+            bucket = by_ticker.get(t.ticker)
+            if bucket is None:
+                bucket = by_ticker[t.ticker] = []
+            bucket.append(t)
+        self._by_ticker = by_ticker
+        self._row_cache.clear()
+        tickers = sorted(by_ticker)
         current = self.ticker_combo.currentText()
         self.ticker_combo.blockSignals(True)
         self.ticker_combo.clear()
@@ -359,24 +439,29 @@ class AssetLedgerWidget(QWidget):
 
     def _on_ticker_changed(self, ticker: str) -> None:
         if not ticker:
-            self._model.set_data([])
+            self._model.set_rows([])
             return
-        filtered = [t for t in self._all_transactions if t.ticker == ticker]
-        self._model.set_data(filtered)
+        self.table.clearSelection()
+        rows = self._row_cache.get(ticker)
+        if rows is None:
+            rows = self._row_cache[ticker] = LedgerTableModel._compute_rows(
+                self._by_ticker.get(ticker, [])
+            )
+        self._model.set_rows(rows)
+        if len(rows) <= _AUTOSIZE_MAX_ROWS:
+            self.table.resizeColumnsToContents()
 
         # Update summary labels from model's final values
         self.lbl_qty.setText(f"Qtd: {self._model.final_qty}")
         self.lbl_avg.setText(f"PM: {_fmt_brl(self._model.final_avg)}")
         self.lbl_cost.setText(f"Custo: {_fmt_brl(self._model.final_cost)}")
 
-    def _get_table_data(self) -> tuple[list[str], list[list[str]]]:
+    def _get_table_data(self) -> tuple[list[str], Iterator[tuple[str, ...]]]:
+        """Headers plus a lazy iterator over the rows' display strings,
+        consumed by the exporters as they write."""
         model = self._model
         headers = list(model.HEADERS)
-        rows = []
-        for row in model._rows:
-            r = [model._display(row, c) for c in range(len(headers))]
-            rows.append(r)
-        return headers, rows
+        return headers, map(model.cells, model._rows)
 
     def _export_pdf(self) -> None:
         ticker = self.ticker_combo.currentText() or "ativos"
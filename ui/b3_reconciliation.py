@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QCoreApplication, QObject, Qt, QThread, Signal, Slot
 from PySide6.QtWidgets import (
     QCheckBox, QDialog, QDialogButtonBox, QFileDialog, QGroupBox,
     QHBoxLayout, QHeaderView, QLabel, QPushButton, QTableView,
@@ -13,6 +13,34 @@ from domain.entities import Transaction
 from ui.table_models import TransactionTableModel
 
 
+class _ParseWorker(QObject):
+    """Runs the parse function off the UI thread, emitting each batch of
+    transactions as it is read; stops between batches when its thread is
+    asked to."""
+
+    batch_ready = Signal(list)   # list[Transaction]
+    failed = Signal(str)
+    finished = Signal()
+
+    def __init__(self, parse_fn, path: str) -> None:
+        super().__init__()
+        self._parse_fn = parse_fn
+        self._path = path
+
+    @Slot()
+    def run(self) -> None:
+        try:
+            thread = QThread.currentThread()
+            for batch in self._parse_fn(self._path):
+                if thread.isInterruptionRequested():
+                    break
+                self.batch_ready.emit(batch)
+        except Exception as e:
+            self.failed.emit(str(e))
+        finally:
+            self.finished.emit()
+
+
 class B3ReconciliationWidget(QWidget):
     """CSV import wizard: pick file → preview → confirm → persist."""
 
@@ -21,14 +49,21 @@ class B3ReconciliationWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._preview_data: list[Transaction] = []
+        self._parse_thread: QThread | None = None
+        self._parse_worker: _ParseWorker | None = None
+        self._parse_failed = False
+        self._selection_touched = False
         self._build_ui()
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._stop_parse)
 
     def _build_ui(self) -> None:
         layout = QVBoxLayout(self)
         layout.setSpacing(8)
 
         title = QLabel("Reconciliação B3 — Importação CSV")
-        title.setStyleSheet("font-size: 18px; font-weight: bold; padding: 4px;")
+        title.setObjectName("pageTitle")
         layout.addWidget(title)
 
         # File picker row
@@ -39,13 +74,13 @@ class B3ReconciliationWidget(QWidget):
         file_row.addWidget(self.btn_pick)
 
         self.lbl_file = QLabel("Nenhum arquivo selecionado")
-        self.lbl_file.setStyleSheet("color: #666; font-style: italic;")
+        self.lbl_file.setObjectName("fileLabel")
         file_row.addWidget(self.lbl_file, 1)
         layout.addLayout(file_row)
 
         # Preview info
         self.lbl_count = QLabel("")
-        self.lbl_count.setStyleSheet("font-weight: bold; font-size: 13px;")
+        self.lbl_count.setObjectName("countLabel")
         layout.addWidget(self.lbl_count)
 
         # Preview table
@@ -59,6 +94,9 @@ class B3ReconciliationWidget(QWidget):
         self.table.verticalHeader().setDefaultSectionSize(26)
         self._model = TransactionTableModel()
         self.table.setModel(self._model)
+        self.table.selectionModel().selectionChanged.connect(
+            self._on_selection_changed
+        )
         g_layout.addWidget(self.table)
         layout.addWidget(group)
 
@@ -83,7 +121,11 @@ class B3ReconciliationWidget(QWidget):
         layout.addLayout(btn_row)
 
     def set_parse_function(self, fn) -> None:
-        """Set the function used to parse CSV files (from use case)."""
+        """Set the function used to parse CSV files (from use case).
+
+        *fn(path)* must yield lists of transactions; they are shown as
+        each batch arrives (see ImportB3CsvUseCase.iter_preview).
+        """
         self._parse_fn = fn
 
     def _pick_file(self) -> None:
@@ -94,16 +136,72 @@ class B3ReconciliationWidget(QWidget):
         if not path:
             return
         self.lbl_file.setText(path)
-        try:
-            self._preview_data = self._parse_fn(path)
-            self._model.set_data(self._preview_data)
-            self.lbl_count.setText(
-                f"{len(self._preview_data)} transação(ões) encontrada(s)"
-            )
-            self.btn_confirm.setEnabled(len(self._preview_data) > 0)
+        self._preview_data = []
+        self._model.set_data([])
+        self._parse_failed = False
+        self._selection_touched = False
+        self.lbl_count.setText("Lendo arquivo…")
+        self.btn_confirm.setEnabled(False)
+        self.btn_pick.setEnabled(False)
+
+        # Parse in the background; rows appear batch by batch
+        thread = QThread(self)
+        worker = _ParseWorker(self._parse_fn, path)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.batch_ready.connect(self._on_batch)
+        worker.failed.connect(self._on_parse_failed)
+        worker.finished.connect(thread.quit)
+        worker.finished.connect(self._on_parse_finished)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        self._parse_thread, self._parse_worker = thread, worker
+        thread.start()
+
+    def _on_batch(self, batch: list[Transaction]) -> None:
+        self._preview_data.extend(batch)
+        self._model.append_batch(batch)
+        self.lbl_count.setText(
+            f"{len(self._preview_data)} transação(ões) encontrada(s)"
+        )
+
+    def _on_parse_failed(self, message: str) -> None:
+        # A partial preview must not be importable
+        self._parse_failed = True
+        self._preview_data = []
+        self._model.set_data([])
+        self.lbl_count.setText("Erro ao ler arquivo")
+        QMessageBox.critical(self, "Erro ao ler CSV", message)
+
+    def _on_parse_finished(self) -> None:
+        self._parse_thread = self._parse_worker = None
+        self.btn_pick.setEnabled(True)
+        if self._parse_failed:
+            return
+        if not self._preview_data:
+            self.lbl_count.setText("0 transação(ões) encontrada(s)")
+            return
+        self.btn_confirm.setEnabled(True)
+        # Keep whatever the user selected while the rows were loading
+        if not self._selection_touched:
             self._select_all()
-        except Exception as e:
-            QMessageBox.critical(self, "Erro ao ler CSV", str(e))
+
+    def _on_selection_changed(self, *_args) -> None:
+        if self._parse_thread is not None:
+            self._selection_touched = True
+
+    def _stop_parse(self) -> None:
+        """Interrupt a running parse and wait for its thread to exit."""
+        thread = self._parse_thread
+        if thread is None:
+            return
+        thread.requestInterruption()
+        thread.quit()
+        thread.wait()
+
+    def closeEvent(self, event) -> None:
+        self._stop_parse()
+        super().closeEvent(event)
 
     def _select_all(self) -> None:
         self.table.selectAll()
@@ -112,12 +210,16 @@ class B3ReconciliationWidget(QWidget):
         self.table.clearSelection()
 
     def _confirm(self) -> None:
-        selected_rows = set(idx.row() for idx in self.table.selectedIndexes())
+        # One index per selected row (the view selects whole rows), not one
+        # per cell as selectedIndexes() would return
+        selected_rows = sorted(
+            idx.row() for idx in self.table.selectionModel().selectedRows()
+        )
         if not selected_rows:
             QMessageBox.information(self, "Aviso", "Selecione ao menos uma transação.")
             return
         confirmed = [
-            self._preview_data[r] for r in sorted(selected_rows)
+            self._preview_data[r] for r in selected_rows
             if r < len(self._preview_data)
         ]
         reply = QMessageBox.question(
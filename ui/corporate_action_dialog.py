@@ -6,8 +6,6 @@ from PySide6.QtWidgets import (
     QDialog, QDialogButtonBox, QLabel, QListWidget, QVBoxLayout,
 )
 
-from ui.styles import WARNING_COLOR
-
 
 class CorporateActionDialog(QDialog):
     """Alert dialog for detected corporate actions (>30% price change)."""
@@ -25,16 +23,13 @@ class CorporateActionDialog(QDialog):
             "detectadas, o que pode indicar um Split ou Inplit:"
         )
         header.setWordWrap(True)
-        header.setStyleSheet(
-            f"font-size: 13px; color: {WARNING_COLOR}; font-weight: bold; "
-            f"padding: 8px;"
-        )
+        header.setObjectName("warningHeader")
         layout.addWidget(header)
 
         self.list_widget = QListWidget()
         for w in warnings:
             self.list_widget.addItem(w)
-        self.list_widget.setStyleSheet("font-size: 12px;")
+        self.list_widget.setObjectName("warningList")
         layout.addWidget(self.list_widget)
 
         info = QLabel(
@@ -42,7 +37,7 @@ class CorporateActionDialog(QDialog):
             "a transação correspondente para ajustar as posições."
         )
         info.setWordWrap(True)
-        info.setStyleSheet("font-size: 11px; color: #666; padding: 4px;")
+        info.setObjectName("hintLabel")
         layout.addWidget(info)
 
         btn_box = QDialogButtonBox(QDialogButtonBox.Ok)
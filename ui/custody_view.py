@@ -74,7 +74,7 @@ class CustodyView(QWidget):
         # Header
         header = QHBoxLayout()
         title = QLabel("Custódia por Instituição")
-        title.setStyleSheet("font-size: 18px; font-weight: bold; padding: 4px;")
+        title.setObjectName("pageTitle")
         header.addWidget(title)
         header.addStretch()
 
@@ -86,12 +86,12 @@ class CustodyView(QWidget):
         header.addWidget(self.refresh_btn)
 
         btn_pdf = QPushButton("📄 PDF")
-        btn_pdf.setStyleSheet("QPushButton { padding: 6px 12px; font-size: 13px; }")
+        btn_pdf.setObjectName("exportBtn")
         btn_pdf.clicked.connect(self._export_pdf)
         header.addWidget(btn_pdf)
 
         btn_csv = QPushButton("📊 CSV")
-        btn_csv.setStyleSheet("QPushButton { padding: 6px 12px; font-size: 13px; }")
+        btn_csv.setObjectName("exportBtn")
         btn_csv.clicked.connect(self._export_csv)
         header.addWidget(btn_csv)
 
@@ -128,9 +128,9 @@ class CustodyView(QWidget):
         if self.main_win is None:
             return
         provider = self.main_win._price_provider
-        tickers = list({c.ticker for c in self._custodians})
-        for ticker in tickers:
-            price = provider.get_last_price(ticker)
+        tickers = {c.ticker for c in self._custodians}
+        # One batched request for every ticker
+        for ticker, price in provider.get_last_prices(tickers).items():
             if price is not None:
                 self._prices[ticker] = price
                 log.info("Market price for %s: %s", ticker, price)
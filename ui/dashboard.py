@@ -167,7 +167,7 @@ class DashboardWidget(QWidget):
 
         # Title
         title = QLabel("Dashboard")
-        title.setStyleSheet("font-size: 18px; font-weight: bold; padding: 4px;")
+        title.setObjectName("pageTitle")
         layout.addWidget(title)
 
         # Cards row
@@ -70,7 +70,7 @@ class TransactionsPage(QWidget):
         # Header row
         header = QHBoxLayout()
         title = QLabel("Transações")
-        title.setStyleSheet("font-size: 18px; font-weight: bold; padding: 4px;")
+        title.setObjectName("pageTitle")
         header.addWidget(title)
         header.addStretch()
 
@@ -235,7 +235,7 @@ class PositionsPage(QWidget):
         # Header with title + buttons
         header = QHBoxLayout()
         title = QLabel("Posições Abertas")
-        title.setStyleSheet("font-size: 18px; font-weight: bold; padding: 4px;")
+        title.setObjectName("pageTitle")
         header.addWidget(title)
         header.addStretch()
 
@@ -255,12 +255,12 @@ class PositionsPage(QWidget):
         header.addWidget(self.refresh_btn)
 
         btn_pdf = QPushButton("📄 PDF")
-        btn_pdf.setStyleSheet("QPushButton { padding: 6px 12px; font-size: 13px; }")
+        btn_pdf.setObjectName("exportBtn")
         btn_pdf.clicked.connect(self._export_pdf)
         header.addWidget(btn_pdf)
 
         btn_csv = QPushButton("📊 CSV")
-        btn_csv.setStyleSheet("QPushButton { padding: 6px 12px; font-size: 13px; }")
+        btn_csv.setObjectName("exportBtn")
         btn_csv.clicked.connect(self._export_csv)
         header.addWidget(btn_csv)
 
@@ -294,9 +294,9 @@ class PositionsPage(QWidget):
         # Fetch market prices for all unique tickers
         prices: dict[str, Decimal] = {}
         provider = self.main_win._price_provider
-        tickers = list({p.ticker for p in positions})
-        for ticker in tickers:
-            price = provider.get_last_price(ticker)
+        tickers = {p.ticker for p in positions}
+        # One batched request for every ticker
+        for ticker, price in provider.get_last_prices(tickers).items():
             if price is not None:
                 prices[ticker] = price
                 log.info("Market price for %s: %s", ticker, price)
@@ -351,7 +351,7 @@ class TaxCalculationPage(QWidget):
         layout = QVBoxLayout(self)
 
         title = QLabel("Apuração de Resultado / IRRF")
-        title.setStyleSheet("font-size: 18px; font-weight: bold; padding: 4px;")
+        title.setObjectName("pageTitle")
         layout.addWidget(title)
 
         # Controls
@@ -380,12 +380,12 @@ class TaxCalculationPage(QWidget):
         controls.addWidget(btn_rebuild)
 
         btn_pdf = QPushButton("📄 PDF")
-        btn_pdf.setStyleSheet("QPushButton { padding: 6px 12px; font-size: 13px; }")
+        btn_pdf.setObjectName("exportBtn")
         btn_pdf.clicked.connect(self._export_pdf)
         controls.addWidget(btn_pdf)
 
         btn_csv = QPushButton("📊 CSV")
-        btn_csv.setStyleSheet("QPushButton { padding: 6px 12px; font-size: 13px; }")
+        btn_csv.setObjectName("exportBtn")
         btn_csv.clicked.connect(self._export_csv)
         controls.addWidget(btn_csv)
 
@@ -408,12 +408,7 @@ class TaxCalculationPage(QWidget):
         try:
             # Get all transactions and recompute sales for the month
             all_txs = TransactionRepository.get_all(session)
-            calc = PositionCalculator()
-            sale_results: list[SaleResult] = []
-            for tx in all_txs:
-                sr = calc.process(tx)
-                if sr is not None:
-                    sale_results.append(sr)
+            sale_results = PositionCalculator().replay(all_txs)
 
             # Filter sales for this month
             monthly_sales = [
@@ -582,12 +577,7 @@ class TaxCalculationPage(QWidget):
         session = self.main_win.read_session()
         try:
             all_txs = TransactionRepository.get_all(session)
-            calc = PositionCalculator()
-            sale_results: list[SaleResult] = []
-            for tx in all_txs:
-                sr = calc.process(tx)
-                if sr is not None:
-                    sale_results.append(sr)
+            sale_results = PositionCalculator().replay(all_txs)
             monthly_sales = [
                 sr for sr in sale_results
                 if sr.date.strftime("%Y-%m") == month_ref
@@ -648,9 +638,10 @@ class MainWindow(QMainWindow):
         ("💰 IR / DARF", 6),
     ]
 
-    def __init__(self, session_factory, write_queue):
+    def __init__(self, session_factory, write_queue, read_session_factory=None):
         super().__init__()
         self._session_factory = session_factory
+        self._read_session_factory = read_session_factory or session_factory
         self.write_queue = write_queue
         self.tax_strict_mode = False
         self._price_provider = YahooFinanceProvider()
@@ -671,7 +662,7 @@ class MainWindow(QMainWindow):
 
     def read_session(self):
         """Create a read-only session (caller must close)."""
-        return self._session_factory()
+        return self._read_session_factory()
 
     def _seed_institutions(self) -> None:
         """Seed default institutions on first run."""
@@ -732,7 +723,7 @@ class MainWindow(QMainWindow):
 
         # Set up B3 import
         import_uc = ImportB3CsvUseCase()
-        self.b3_reconciliation.set_parse_function(import_uc.parse_preview)
+        self.b3_reconciliation.set_parse_function(import_uc.iter_preview)
         self.b3_reconciliation.import_confirmed.connect(self._on_b3_import)
 
         # Price sync: Positions ↔ Custody
@@ -920,11 +911,11 @@ class MainWindow(QMainWindow):
 
             count = self.write_queue.submit_and_wait(do_import)
 
-            # Rebuild positions after import
+            # Rebuild positions after import (append-only, so fold it in)
             uc = RebuildAllUseCase()
 
             def do_rebuild(session):
-                return uc.execute(session)
+                return uc.execute_incremental(session)
 
             self.write_queue.submit_and_wait(do_rebuild, timeout=120)
             self.refresh_all()
@@ -1,5 +1,7 @@
 """Semantic color constants and stylesheet helpers."""
 
+import functools
+
 # ── Semantic colors ────────────────────────────────────────────────────
 PROFIT_COLOR  = "#009600"
 LOSS_COLOR    = "#C80000"
@@ -136,6 +138,48 @@ QLabel#lossLabel {
     color: #C80000;
     font-weight: bold;
 }
+
+QLabel#pageTitle {
+    font-size: 18px;
+    font-weight: bold;
+    padding: 4px;
+}
+
+QPushButton#exportBtn {
+    padding: 6px 12px;
+    font-size: 13px;
+}
+
+QLabel#summaryLabel {
+    font-weight: bold;
+}
+
+QLabel#fileLabel {
+    color: #666666;
+    font-style: italic;
+}
+
+QLabel#countLabel {
+    font-size: 13px;
+    font-weight: bold;
+}
+
+QLabel#warningHeader {
+    font-size: 13px;
+    color: #E68A00;
+    font-weight: bold;
+    padding: 8px;
+}
+
+QListWidget#warningList {
+    font-size: 12px;
+}
+
+QLabel#hintLabel {
+    font-size: 11px;
+    color: #666666;
+    padding: 4px;
+}
 """
 
 
@@ -146,3 +190,17 @@ def profit_loss_color(value: float) -> str:
     elif value < 0:
         return LOSS_COLOR
     return NEUTRAL_COLOR
+
+
+@functools.cache
+def bold_font():
+    """Shared bold QFont for model FontRole data.
+
+    Built on first use rather than at import, since a QFont needs the
+    QGuiApplication to exist; callers must not modify it.
+    """
+    from PySide6.QtGui import QFont
+
+    font = QFont()
+    font.setBold(True)
+    return font
@@ -12,7 +12,7 @@ from babel.numbers import format_currency
 
 from domain.entities import Position, Transaction
 from domain.enums import Currency
-from ui.styles import PROFIT_COLOR, LOSS_COLOR
+from ui.styles import PROFIT_COLOR, LOSS_COLOR, bold_font
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -21,6 +21,11 @@ from ui.styles import PROFIT_COLOR, LOSS_COLOR
 
 ZERO = Decimal("0")
 
+# Returned by data() on every paint; shared instead of built per call
+_PROFIT_QCOLOR = QColor(PROFIT_COLOR)
+_LOSS_QCOLOR = QColor(LOSS_COLOR)
+
+
 def _fmt_money(value: Decimal, currency: Currency) -> str:
     locale = "pt_BR" if currency == Currency.BRL else "en_US"
     curr = "BRL" if currency == Currency.BRL else "USD"
@@ -56,6 +61,15 @@ class TransactionTableModel(QAbstractTableModel):
         self._data = transactions
         self.endResetModel()
 
+    def append_batch(self, transactions: list[Transaction]) -> None:
+        """Append rows at the end without resetting the view."""
+        if not transactions:
+            return
+        n = len(self._data)
+        self.beginInsertRows(QModelIndex(), n, n + len(transactions) - 1)
+        self._data.extend(transactions)
+        self.endInsertRows()
+
     def get_transaction(self, row: int) -> Transaction | None:
         if 0 <= row < len(self._data):
             return self._data[row]
@@ -118,9 +132,9 @@ class TransactionTableModel(QAbstractTableModel):
     def _foreground(tx: Transaction, col: int) -> Optional[QColor]:
         if col == 2:
             if tx.type.value == "BUY":
-                return QColor(PROFIT_COLOR)
+                return _PROFIT_QCOLOR
             if tx.type.value == "SELL":
-                return QColor(LOSS_COLOR)
+                return _LOSS_QCOLOR
         return None
 
 
@@ -338,35 +352,30 @@ class PositionTableModel(QAbstractTableModel):
                         (self._unrealized_gain(p) or ZERO) for p in self._data
                     )
                     if total_gain > ZERO:
-                        return QColor(PROFIT_COLOR)
+                        return _PROFIT_QCOLOR
                     if total_gain < ZERO:
-                        return QColor(LOSS_COLOR)
+                        return _LOSS_QCOLOR
                 return None
             pos = self._data[row]
             if col == self._COL_PU:
                 mkt = self._prices.get(pos.ticker)
                 if mkt is not None and pos.avg_price > ZERO:
                     if mkt > pos.avg_price:
-                        return QColor(PROFIT_COLOR)
+                        return _PROFIT_QCOLOR
                     if mkt < pos.avg_price:
-                        return QColor(LOSS_COLOR)
+                        return _LOSS_QCOLOR
                 return None
             if col == self._COL_RESULT:
                 gain = self._unrealized_gain(pos)
                 if gain is not None:
                     if gain > ZERO:
-                        return QColor(PROFIT_COLOR)
+                        return _PROFIT_QCOLOR
                     if gain < ZERO:
-                        return QColor(LOSS_COLOR)
+                        return _LOSS_QCOLOR
             return None
 
         if role == Qt.FontRole:
-            if is_totals:
-                from PySide6.QtGui import QFont
-                font = QFont()
-                font.setBold(True)
-                return font
-            return None
+            return bold_font() if is_totals else None
 
         if role == Qt.TextAlignmentRole:
             if col >= 2: